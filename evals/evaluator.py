@@ -1,13 +1,15 @@
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
+import os
 import sys
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 ROOT = Path(__file__).resolve().parents[1]
-sys.path.append(str(ROOT / "src"))
-
-import yaml
+SRC_PATH = str(ROOT / "src")
+if SRC_PATH not in sys.path:
+    sys.path.append(SRC_PATH)
 
 from boostburn.adapters.local_s3 import LocalS3Adapter
 
@@ -15,13 +17,21 @@ from boostburn.adapters.pricing import StaticPricingProvider
 from boostburn.adapters.report_store import ReportStore
 from boostburn.adapters.slack import RecordingSlackAdapter
 from boostburn.graph.workflow import Dependencies, RunConfig, build_graph
+from boostburn.yaml_utils import load_yaml
+
+# Bucket maps keyed by buckets_root, shared by every case run in this process
+_BUCKET_MAP_CACHE: Dict[str, Dict[str, Path]] = {}
 
 
 def main() -> int:
-    cases = yaml.safe_load(Path("evals/golden_data.yaml").read_text()) or []
+    with Path("evals/golden_data.yaml").open("rb") as handle:
+        cases = load_yaml(handle) or []
     failures: List[str] = []
-    for case in cases:
-        errors = run_case(case)
+    # Cases are independent (own manifest prefix and state dir), so run them in parallel
+    max_workers = max(1, min(len(cases), os.cpu_count() or 1))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(run_case, cases))
+    for case, errors in zip(cases, results):
         if errors:
             failures.append(case["id"])
             for error in errors:
@@ -35,29 +45,33 @@ def main() -> int:
 
 
 def run_case(case: Dict[str, Any]) -> List[str]:
-    config_path = Path(case.get("config_path", "evals/fixtures/config.yaml"))
-    pricing_cache_path = Path(case.get("pricing_cache_path", "evals/fixtures/pricing_cache_full.json"))
-    pricing_path = Path(case.get("pricing_path", "config/pricing.yaml"))
-    state_dir = Path(case.get("state_dir", "evals/fixtures/state"))
+    # Keep case paths as strings; only wrap them in Path at filesystem boundaries
+    config_path = case.get("config_path", "evals/fixtures/config.yaml")
+    pricing_cache_path = case.get("pricing_cache_path", "evals/fixtures/pricing_cache_full.json")
+    pricing_path = case.get("pricing_path", "config/pricing.yaml")
+    state_dir = Path(case.get("state_dir", f"evals/fixtures/state/{case['id']}"))
     report_date = case.get("report_date", "2026-02-01")
 
-    buckets_root = Path(case.get("buckets_root", "evals/fixtures/buckets"))
-    bucket_map = {path.name: path for path in buckets_root.iterdir() if path.is_dir()}
+    buckets_root = case.get("buckets_root", "evals/fixtures/buckets")
+    bucket_map = _BUCKET_MAP_CACHE.get(buckets_root)
+    if bucket_map is None:
+        bucket_map = _BUCKET_MAP_CACHE[buckets_root] = _scan_buckets(buckets_root)
 
     manifest_prefix = f"manifests/{case['id']}"
     _clear_manifest(bucket_map, manifest_prefix)
-    _clear_snapshot(state_dir, report_date)
+    report_store = ReportStore(state_dir=state_dir)
+    _clear_snapshot(report_store, report_date)
 
     deps = Dependencies(
         s3=LocalS3Adapter(bucket_map),
         pricing=StaticPricingProvider(pricing_path=_select_pricing_path(pricing_path, pricing_cache_path)),
-        report_store=ReportStore(state_dir=state_dir),
+        report_store=report_store,
         slack=RecordingSlackAdapter(),
         logger=_null_logger(),
     )
 
     run_config = RunConfig(
-        config_path=str(config_path),
+        config_path=config_path,
         manifest_prefix=manifest_prefix,
         lookback_hours=int(case.get("lookback_hours", 6)),
         report_date=report_date,
@@ -69,16 +83,22 @@ def run_case(case: Dict[str, Any]) -> List[str]:
     return validate_case(case, result, deps)
 
 
-def _select_pricing_path(default_path: Path, cache_path: Path) -> Path:
-    if cache_path.suffix == ".json":
-        candidate = cache_path.with_suffix(".yaml")
-        if candidate.exists():
+def _scan_buckets(buckets_root: str) -> Dict[str, Path]:
+    with os.scandir(buckets_root) as entries:
+        return {entry.name: Path(entry.path) for entry in entries if entry.is_dir(follow_symlinks=False)}
+
+
+def _select_pricing_path(default_path: str, cache_path: str) -> str:
+    stem, suffix = os.path.splitext(cache_path)
+    if suffix == ".json":
+        candidate = f"{stem}.yaml"
+        if os.path.exists(candidate):
             return candidate
     return default_path
 
 
-def _clear_snapshot(state_dir: Path, report_date: str) -> None:
-    path = state_dir / f"bedrock-usage-{report_date}.yaml"
+def _clear_snapshot(report_store: ReportStore, report_date: str) -> None:
+    path = report_store.snapshot_path(report_date)
     if path.exists():
         path.unlink()
 
@@ -99,23 +119,26 @@ def validate_case(case: Dict[str, Any], result: Dict[str, Any], deps: Dependenci
             f"min_cost_usd expected >= {expect['min_cost_usd']} got {metrics.totals.cost_usd}"
         )
 
-    for region, expected_region in expect.get("by_region", {}).items():
-        actual = metrics.by_region.get(region)
-        if not actual:
-            errors.append(f"missing region stats for {region}")
-            continue
+    expected_regions = expect.get("by_region", {})
+    for region in sorted(expected_regions.keys() - metrics.by_region.keys()):
+        errors.append(f"missing region stats for {region}")
+    for region in sorted(expected_regions.keys() & metrics.by_region.keys()):
+        expected_region = expected_regions[region]
+        actual = metrics.by_region[region]
         if "total_tokens" in expected_region and actual.total_tokens != expected_region["total_tokens"]:
             errors.append(
                 f"region {region} total_tokens expected {expected_region['total_tokens']} got {actual.total_tokens}"
             )
 
+    slack_text = _last_slack_text(deps)
     for needle in expect.get("slack_contains", []):
-        if not deps.slack or not deps.slack.messages or needle not in deps.slack.messages[-1]["text"]:
+        if slack_text is None or needle not in slack_text:
             errors.append(f"slack message missing '{needle}'")
 
-    for needle in expect.get("slack_not_contains", []):
-        if deps.slack and deps.slack.messages and needle in deps.slack.messages[-1]["text"]:
-            errors.append(f"slack message should not contain '{needle}'")
+    if slack_text is not None:
+        for needle in expect.get("slack_not_contains", []):
+            if needle in slack_text:
+                errors.append(f"slack message should not contain '{needle}'")
 
     # Validate unpriced_models with exact matching
     if "unpriced_models" in expect:
@@ -123,7 +146,9 @@ def validate_case(case: Dict[str, Any], result: Dict[str, Any], deps: Dependenci
         actual_unpriced = set(warnings.unpriced_models or [])
         if expected_unpriced != actual_unpriced:
             errors.append(
-                f"unpriced_models mismatch: expected {expected_unpriced}, got {actual_unpriced}"
+                "unpriced_models mismatch: "
+                f"missing {sorted(expected_unpriced - actual_unpriced)}, "
+                f"unexpected {sorted(actual_unpriced - expected_unpriced)}"
             )
 
     if expect.get("no_usage") and metrics.totals.total_tokens != 0:
@@ -135,6 +160,12 @@ def validate_case(case: Dict[str, Any], result: Dict[str, Any], deps: Dependenci
     return errors
 
 
+def _last_slack_text(deps: Dependencies) -> Optional[str]:
+    if not deps.slack or not deps.slack.messages:
+        return None
+    return deps.slack.messages[-1]["text"]
+
+
 def _null_logger():
     class _Logger:
         def info(self, *_: Any, **__: Any) -> None:
@@ -144,11 +175,10 @@ def _null_logger():
 
 
 def _clear_manifest(bucket_map, manifest_prefix: str) -> None:
-    manifest_key = f"{manifest_prefix.strip('/')}/bedrock-usage/manifest.json"
+    manifests_dir = f"{manifest_prefix.strip('/')}/bedrock-usage"
     for bucket_root in bucket_map.values():
-        path = bucket_root / manifest_key
-        if path.exists():
-            path.unlink()
+        for manifest_path in (bucket_root / manifests_dir).glob("*/manifest.json"):
+            manifest_path.unlink()
 
 
 if __name__ == "__main__":
@@ -4,7 +4,9 @@ import argparse
 from pathlib import Path
 import sys
 
-sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+SRC_PATH = str(Path(__file__).resolve().parents[1] / "src")
+if SRC_PATH not in sys.path:
+    sys.path.append(SRC_PATH)
 
 from boostburn.pricing_scraper import (
     PRICING_URL,
@@ -2,13 +2,19 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Iterable, List, Optional
+import io
+from typing import BinaryIO, Iterable, List, Optional, Tuple
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
+# Regions (up to 8) and their object fetches (up to 4 each) share one client; size the
+# connection pool for that instead of botocore's default of 10
+_S3_CLIENT_CONFIG = Config(max_pool_connections=32)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class S3Object:
     key: str
     etag: str
@@ -22,37 +28,44 @@ class S3Adapter:
     def get_object_bytes(self, bucket: str, key: str) -> bytes:
         raise NotImplementedError
 
+    def get_object_stream(self, bucket: str, key: str) -> BinaryIO:
+        return io.BytesIO(self.get_object_bytes(bucket, key))
+
     def put_object(self, bucket: str, key: str, body: bytes, content_type: str = "application/json") -> str:
         raise NotImplementedError
 
     def get_object_etag(self, bucket: str, key: str) -> Optional[str]:
         raise NotImplementedError
 
+    def get_object(self, bucket: str, key: str) -> Tuple[Optional[bytes], Optional[str]]:
+        """Return (body, etag), or (None, None) when the key does not exist."""
+        etag = self.get_object_etag(bucket, key)
+        if etag is None:
+            return None, None
+        return self.get_object_bytes(bucket, key), etag
+
 
 class AwsS3Adapter(S3Adapter):
-    def __init__(self) -> None:
-        self._client = boto3.client("s3")
+    def __init__(self, session: Optional[boto3.Session] = None) -> None:
+        self._client = (session or boto3).client("s3", config=_S3_CLIENT_CONFIG)
+        self._list_paginator = self._client.get_paginator("list_objects_v2")
 
     def list_objects(self, bucket: str, prefix: str) -> List[S3Object]:
         objects: List[S3Object] = []
-        token: Optional[str] = None
-        while True:
-            params = {"Bucket": bucket, "Prefix": prefix}
-            if token:
-                params["ContinuationToken"] = token
-            response = self._client.list_objects_v2(**params)
-            for item in response.get("Contents", []) or []:
-                etag = item.get("ETag", "").strip('"')
-                objects.append(S3Object(key=item["Key"], etag=etag, last_modified=item["LastModified"]))
-            if not response.get("IsTruncated"):
-                break
-            token = response.get("NextContinuationToken")
+        for page in self._list_paginator.paginate(Bucket=bucket, Prefix=prefix):
+            objects.extend(
+                S3Object(key=item["Key"], etag=_unquote_etag(item.get("ETag", "")), last_modified=item["LastModified"])
+                for item in page.get("Contents") or ()
+            )
         return objects
 
     def get_object_bytes(self, bucket: str, key: str) -> bytes:
         response = self._client.get_object(Bucket=bucket, Key=key)
         return response["Body"].read()
 
+    def get_object_stream(self, bucket: str, key: str) -> BinaryIO:
+        return self._client.get_object(Bucket=bucket, Key=key)["Body"]
+
     def put_object(self, bucket: str, key: str, body: bytes, content_type: str = "application/json") -> str:
         response = self._client.put_object(
             Bucket=bucket,
@@ -60,7 +73,7 @@ class AwsS3Adapter(S3Adapter):
             Body=body,
             ContentType=content_type,
         )
-        return response.get("ETag", "").strip('"')
+        return _unquote_etag(response.get("ETag", ""))
 
     def get_object_etag(self, bucket: str, key: str) -> Optional[str]:
         try:
@@ -69,4 +82,21 @@ class AwsS3Adapter(S3Adapter):
             if exc.response.get("Error", {}).get("Code") in {"404", "NoSuchKey", "NotFound"}:
                 return None
             raise
-        return response.get("ETag", "").strip('"')
+        return _unquote_etag(response.get("ETag", ""))
+
+    def get_object(self, bucket: str, key: str) -> Tuple[Optional[bytes], Optional[str]]:
+        # A single GET returns both the body and the ETag, saving the HEAD round-trip
+        try:
+            response = self._client.get_object(Bucket=bucket, Key=key)
+        except ClientError as exc:
+            if exc.response.get("Error", {}).get("Code") in {"404", "NoSuchKey", "NotFound"}:
+                return None, None
+            raise
+        return response["Body"].read(), _unquote_etag(response.get("ETag", ""))
+
+
+def _unquote_etag(etag: str) -> str:
+    # S3 returns ETags wrapped in double quotes; slice them off without a strip scan
+    if len(etag) >= 2 and etag[0] == '"' and etag[-1] == '"':
+        return etag[1:-1]
+    return etag
@@ -2,13 +2,14 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timezone
+import os
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import BinaryIO, Dict, List, Optional
 
 from .aws_s3 import S3Adapter, S3Object
 
 
-@dataclass
+@dataclass(slots=True)
 class LocalBucket:
     name: str
     root: Path
@@ -21,17 +22,38 @@ class LocalS3Adapter(S3Adapter):
     def list_objects(self, bucket: str, prefix: str) -> List[S3Object]:
         root = self._bucket_root(bucket)
         objects: List[S3Object] = []
-        for path in root.rglob("*"):
-            if path.is_dir():
+        # Start at the directory named by the prefix; only its last, partial
+        # component still needs a startswith check.
+        start_key = prefix[: prefix.rfind("/") + 1]
+        stack = [(os.path.join(root, start_key), start_key)]
+        while stack:
+            dir_path, dir_key = stack.pop()
+            try:
+                entries = os.scandir(dir_path)
+            except (FileNotFoundError, NotADirectoryError):
                 continue
-            key = path.relative_to(root).as_posix()
-            if not key.startswith(prefix):
-                continue
-            stat = path.stat()
-            etag = f"{stat.st_size}-{int(stat.st_mtime)}"
-            objects.append(
-                S3Object(key=key, etag=etag, last_modified=datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc))
-            )
+            with entries:
+                for entry in entries:
+                    key = dir_key + entry.name
+                    # is_dir() follows symlinks, so a symlinked directory is walked rather
+                    # than listed as an object
+                    if entry.is_dir():
+                        child_key = key + "/"
+                        # Only descend into directories that can still hold keys under prefix
+                        if child_key.startswith(prefix) or prefix.startswith(child_key):
+                            stack.append((entry.path, child_key))
+                        continue
+                    if not key.startswith(prefix):
+                        continue
+                    stat = entry.stat()
+                    etag = f"{stat.st_size}-{int(stat.st_mtime)}"
+                    objects.append(
+                        S3Object(
+                            key=key,
+                            etag=etag,
+                            last_modified=datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc),
+                        )
+                    )
         return objects
 
     def get_object_bytes(self, bucket: str, key: str) -> bytes:
@@ -39,20 +61,28 @@ class LocalS3Adapter(S3Adapter):
         path = root / key
         return path.read_bytes()
 
+    def get_object_stream(self, bucket: str, key: str) -> BinaryIO:
+        root = self._bucket_root(bucket)
+        return (root / key).open("rb")
+
     def put_object(self, bucket: str, key: str, body: bytes, content_type: str = "application/json") -> str:
         root = self._bucket_root(bucket)
         path = root / key
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_bytes(body)
-        stat = path.stat()
+        with path.open("wb") as handle:
+            handle.write(body)
+            handle.flush()
+            # fstat on the open descriptor yields the mtime later reads will report
+            stat = os.fstat(handle.fileno())
         return f"{stat.st_size}-{int(stat.st_mtime)}"
 
     def get_object_etag(self, bucket: str, key: str) -> Optional[str]:
         root = self._bucket_root(bucket)
         path = root / key
-        if not path.exists():
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
             return None
-        stat = path.stat()
         return f"{stat.st_size}-{int(stat.st_mtime)}"
 
     def _bucket_root(self, bucket: str) -> Path:
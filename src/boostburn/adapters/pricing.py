@@ -2,14 +2,15 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 import re
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
-import yaml
+from ..yaml_utils import load_yaml
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PriceRate:
     input_per_1k: float
     output_per_1k: float
@@ -35,11 +36,18 @@ class StaticPricingProvider(PricingProvider):
     ) -> None:
         self._pricing_path = Path(pricing_path)
         self._now_fn = now_fn or (lambda: datetime.now(timezone.utc))
-        self._rates: Optional[Dict[str, Dict[str, PriceRate]]] = None
+        # Flattened at refresh so get_rate is a single tuple probe plus the default fallback
+        self._rates: Optional[Dict[Tuple[str, str], PriceRate]] = None
+        self._defaults: Dict[str, PriceRate] = {}
 
     def refresh(self, model_ids: Optional[set[str]] = None) -> None:
-        rates = _load_pricing_yaml(self._pricing_path)
-        self._rates = _filter_rates(rates, model_ids)
+        rates = _filter_rates(_load_pricing_yaml(self._pricing_path), model_ids)
+        self._rates = {
+            (model_key, region): rate for model_key, region_map in rates.items() for region, rate in region_map.items()
+        }
+        self._defaults = {
+            model_key: region_map["default"] for model_key, region_map in rates.items() if "default" in region_map
+        }
 
     def get_rate(self, model_id: str, region: str) -> Optional[PriceRate]:
         """Get pricing rate for a model in a region.
@@ -52,15 +60,13 @@ class StaticPricingProvider(PricingProvider):
 
         # Direct lookup using pricing key (preserves inference profile)
         pricing_key = get_pricing_model_key(model_id)
-        model_rates = (self._rates or {}).get(pricing_key)
-        if model_rates:
-            if region in model_rates:
-                return model_rates[region]
-            if "default" in model_rates:
-                return model_rates["default"]
+        return self._rates.get((pricing_key, region)) or self._defaults.get(pricing_key)
 
-        return None
 
+# Latest parsed pricing table per path, tagged with the (mtime_ns, size) it was read at.
+# A changed file replaces its entry, so the cache holds one table per pricing file.
+# PriceRate is frozen, so providers can share the parsed tables safely.
+_PRICING_CACHE: Dict[str, tuple[int, int, Dict[str, Dict[str, PriceRate]]]] = {}
 
 _KNOWN_PROVIDERS = {
     "anthropic",
@@ -78,7 +84,16 @@ _KNOWN_PROVIDERS = {
 
 _KNOWN_SCOPES = {"global", "us", "eu", "ap", "sa", "me", "af", "ca"}
 
+# ".", "/" and "_" become spaces; runs need no collapsing since tokens are pulled out with findall
+_SEPARATOR_TABLE = str.maketrans("./_", "   ")
+_CAMEL_CASE_PATTERN = re.compile(r"([a-z])([A-Z])")
+_DIGIT_LETTER_PATTERN = re.compile(r"(\d)([A-Za-z])")
+_LETTER_DIGIT_PATTERN = re.compile(r"([A-Za-z])(\d)")
+_TOKEN_PATTERN = re.compile(r"[A-Za-z0-9]+")
+_VERSION_TOKEN_PATTERN = re.compile(r"v\d+")
+
 
+@lru_cache(maxsize=2048)
 def normalize_model_id(model_id: str) -> str:
     value = model_id
     if value.startswith("arn:"):
@@ -88,6 +103,7 @@ def normalize_model_id(model_id: str) -> str:
     return value
 
 
+@lru_cache(maxsize=2048)
 def get_pricing_model_key(original_model_id: str) -> str:
     """Extract the model key for pricing lookup, preserving inference profile prefix.
 
@@ -130,6 +146,7 @@ def get_pricing_model_key(original_model_id: str) -> str:
     return result
 
 
+@lru_cache(maxsize=4096)
 def canonical_model_key(model_id: str) -> str:
     """Canonical model key used by pricing scraper.
 
@@ -143,11 +160,11 @@ def canonical_model_key(model_id: str) -> str:
     parts = value.split(".")
     if len(parts) >= 3 and parts[0].lower() in _KNOWN_SCOPES and parts[1].lower() in _KNOWN_PROVIDERS:
         value = ".".join(parts[1:])
-    value = re.sub(r"[\./_]+", " ", value)
-    value = re.sub(r"([a-z])([A-Z])", r"\1 \2", value)
-    value = re.sub(r"(\d)([A-Za-z])", r"\1 \2", value)
-    value = re.sub(r"([A-Za-z])(\d)", r"\1 \2", value)
-    tokens = re.findall(r"[A-Za-z0-9]+", value)
+    value = value.translate(_SEPARATOR_TABLE)
+    value = _CAMEL_CASE_PATTERN.sub(r"\1 \2", value)
+    value = _DIGIT_LETTER_PATTERN.sub(r"\1 \2", value)
+    value = _LETTER_DIGIT_PATTERN.sub(r"\1 \2", value)
+    tokens = _TOKEN_PATTERN.findall(value)
     normalized: list[str] = []
     index = 0
     while index < len(tokens):
@@ -156,7 +173,7 @@ def canonical_model_key(model_id: str) -> str:
         if lowered == "v" and next_token.isdigit():
             index += 2
             continue
-        if re.fullmatch(r"v\d+", lowered):
+        if _VERSION_TOKEN_PATTERN.fullmatch(lowered):
             index += 1
             continue
         if lowered.isdigit() and len(lowered) >= 6:
@@ -183,9 +200,22 @@ def _filter_rates(
 
 
 def _load_pricing_yaml(path: Path) -> Dict[str, Dict[str, PriceRate]]:
-    if not path.exists():
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
         return {}
-    payload = yaml.safe_load(path.read_text())
+    cache_key = str(path)
+    cached = _PRICING_CACHE.get(cache_key)
+    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2]
+    rates = _parse_pricing_yaml(path)
+    _PRICING_CACHE[cache_key] = (stat.st_mtime_ns, stat.st_size, rates)
+    return rates
+
+
+def _parse_pricing_yaml(path: Path) -> Dict[str, Dict[str, PriceRate]]:
+    with path.open("rb") as handle:
+        payload = load_yaml(handle)
     if payload is None:
         return {}
     raw_rates = payload.get("rates") if isinstance(payload, dict) else None
@@ -196,35 +226,36 @@ def _load_pricing_yaml(path: Path) -> Dict[str, Dict[str, PriceRate]]:
 
     rates: Dict[str, Dict[str, PriceRate]] = {}
     for model_id, region_map in raw_rates.items():
-        if not isinstance(region_map, dict):
+        if type(region_map) is not dict:
             continue
         # Use get_pricing_model_key to preserve inference profile prefixes
         pricing_key = get_pricing_model_key(str(model_id))
         if not pricing_key:
             continue
-
-        for region, rate in region_map.items():
-            if not isinstance(rate, dict):
-                continue
-            input_rate = rate.get("input_per_1k")
-            output_rate = rate.get("output_per_1k")
-            if input_rate is None and output_rate is None:
-                continue
-            missing_input = input_rate is None
-            missing_output = output_rate is None
-            try:
-                input_val = float(input_rate) if input_rate is not None else 0.0
-                output_val = float(output_rate) if output_rate is not None else 0.0
-            except (TypeError, ValueError):
-                continue
-            price_rate = PriceRate(
-                input_per_1k=input_val,
-                output_per_1k=output_val,
-                currency=rate.get("currency", "USD"),
-                effective_date=rate.get("effective_date"),
-                missing_input=missing_input,
-                missing_output=missing_output,
-            )
+        region_rates = {
+            region: price_rate
+            for region, rate in region_map.items()
+            if type(rate) is dict and (price_rate := _build_price_rate(rate)) is not None
+        }
+        if region_rates:
             # Store only under pricing key (no aliases)
-            rates.setdefault(pricing_key, {})[region] = price_rate
+            rates.setdefault(pricing_key, {}).update(region_rates)
     return rates
+
+
+def _build_price_rate(rate: dict) -> Optional[PriceRate]:
+    input_rate = rate.get("input_per_1k")
+    output_rate = rate.get("output_per_1k")
+    if input_rate is None and output_rate is None:
+        return None
+    try:
+        return PriceRate(
+            input_per_1k=0.0 if input_rate is None else float(input_rate),
+            output_per_1k=0.0 if output_rate is None else float(output_rate),
+            currency=rate.get("currency", "USD"),
+            effective_date=rate.get("effective_date"),
+            missing_input=input_rate is None,
+            missing_output=output_rate is None,
+        )
+    except (TypeError, ValueError):
+        return None
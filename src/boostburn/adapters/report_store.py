@@ -1,95 +1,94 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import csv
 from pathlib import Path
-from typing import Mapping, Optional, Sequence
+from typing import IO, Any, Mapping, Optional, Sequence
 
-import yaml
+from ..json_utils import dump_json, load_json
+from ..yaml_utils import load_yaml
 
 
-@dataclass(frozen=True)
+@dataclass
 class ReportStore:
     state_dir: Path
     csv_path: Optional[Path] = None
+    _csv_handle: Optional[IO[str]] = field(default=None, init=False, repr=False, compare=False)
+    _csv_writer: Any = field(default=None, init=False, repr=False, compare=False)
+
+    def snapshot_path(self, report_date: str) -> Path:
+        return self.state_dir / f"bedrock-usage-{report_date}.json"
 
     def write_snapshot(self, report_date: str, snapshot: Mapping[str, object]) -> Path:
         self.state_dir.mkdir(parents=True, exist_ok=True)
-        path = self.state_dir / f"bedrock-usage-{report_date}.yaml"
-        payload = yaml.safe_dump(snapshot, sort_keys=False)
-        path.write_text(payload, encoding="utf-8")
+        path = self.snapshot_path(report_date)
+        path.write_bytes(dump_json(snapshot, indent=True))
         return path
 
     def read_snapshot(self, report_date: str) -> Optional[dict]:
-        """Read existing snapshot for a report date, returns None if not found."""
-        path = self.state_dir / f"bedrock-usage-{report_date}.yaml"
+        """Read existing snapshot for a report date, returns None if not found.
+
+        Without a JSON snapshot, the YAML one written by earlier versions is read instead;
+        the next write_snapshot replaces it with JSON.
+        """
+        path = self.snapshot_path(report_date)
+        loader = load_json
         if not path.exists():
-            return None
+            path = self.state_dir / f"bedrock-usage-{report_date}.yaml"
+            loader = load_yaml
+            if not path.exists():
+                return None
         try:
-            content = path.read_text(encoding="utf-8")
-            return yaml.safe_load(content)
+            return loader(path.read_bytes())
         except Exception:
             return None  # Corrupted file, treat as missing
 
-    def append_csv_row(self, row: Mapping[str, object], fieldnames: Sequence[str]) -> Optional[Path]:
+    def append_csv_row(self, row: Sequence[object], fieldnames: Sequence[str]) -> Optional[Path]:
+        """Append one row whose values are already in fieldnames order."""
         if self.csv_path is None:
             return None
-        self.csv_path.parent.mkdir(parents=True, exist_ok=True)
-        is_new = not self.csv_path.exists() or self.csv_path.stat().st_size == 0
-        with self.csv_path.open("a", newline="", encoding="utf-8") as handle:
-            writer = csv.DictWriter(handle, fieldnames=fieldnames)
-            if is_new:
-                writer.writeheader()
-            writer.writerow(row)
+        handle = self._csv_handle
+        if handle is None:
+            # Open once and keep the handle for later rows; close() flushes and releases it
+            self.csv_path.parent.mkdir(parents=True, exist_ok=True)
+            handle = self._csv_handle = self.csv_path.open("a", newline="", encoding="utf-8", buffering=65536)
+            self._csv_writer = csv.writer(handle)
+            # Append mode opens at end of file, so position 0 means an empty file
+            if handle.tell() == 0:
+                self._csv_writer.writerow(fieldnames)
+        self._csv_writer.writerow(row)
         return self.csv_path
 
+    def close(self) -> None:
+        if self._csv_handle is not None:
+            self._csv_handle.close()
+            self._csv_handle = None
+            self._csv_writer = None
+
+
+_TOKEN_STATS_FIELDS = ("input_tokens", "output_tokens", "total_tokens", "cost_usd")
+
 
 def load_metrics_from_snapshot(snapshot: dict) -> Optional[Metrics]:
     """Extract and deserialize Metrics from a snapshot dict."""
     from ..models import Metrics, TokenStats
 
+    def to_stats(stats_dict: dict) -> TokenStats:
+        return TokenStats(**{name: stats_dict[name] for name in _TOKEN_STATS_FIELDS if name in stats_dict})
+
     try:
         metrics_dict = snapshot.get("metrics", {})
         metrics = Metrics()
 
-        # Load totals
         if "totals" in metrics_dict:
-            t = metrics_dict["totals"]
-            metrics.totals = TokenStats(
-                input_tokens=t.get("input_tokens", 0),
-                output_tokens=t.get("output_tokens", 0),
-                total_tokens=t.get("total_tokens", 0),
-                cost_usd=t.get("cost_usd", 0.0),
-            )
-
-        # Load by_region
-        for region, stats_dict in metrics_dict.get("by_region", {}).items():
-            metrics.by_region[region] = TokenStats(
-                input_tokens=stats_dict.get("input_tokens", 0),
-                output_tokens=stats_dict.get("output_tokens", 0),
-                total_tokens=stats_dict.get("total_tokens", 0),
-                cost_usd=stats_dict.get("cost_usd", 0.0),
-            )
-
-        # Load by_identity
-        for identity, stats_dict in metrics_dict.get("by_identity", {}).items():
-            metrics.by_identity[identity] = TokenStats(
-                input_tokens=stats_dict.get("input_tokens", 0),
-                output_tokens=stats_dict.get("output_tokens", 0),
-                total_tokens=stats_dict.get("total_tokens", 0),
-                cost_usd=stats_dict.get("cost_usd", 0.0),
-            )
-
-        # Load by_model
-        for model, stats_dict in metrics_dict.get("by_model", {}).items():
-            metrics.by_model[model] = TokenStats(
-                input_tokens=stats_dict.get("input_tokens", 0),
-                output_tokens=stats_dict.get("output_tokens", 0),
-                total_tokens=stats_dict.get("total_tokens", 0),
-                cost_usd=stats_dict.get("cost_usd", 0.0),
-            )
+            metrics.totals = to_stats(metrics_dict["totals"])
+
+        metrics.by_region = {region: to_stats(sd) for region, sd in metrics_dict.get("by_region", {}).items()}
+        metrics.by_identity = {identity: to_stats(sd) for identity, sd in metrics_dict.get("by_identity", {}).items()}
+        metrics.by_model = {model: to_stats(sd) for model, sd in metrics_dict.get("by_model", {}).items()}
 
         # Load by_usage_key for pricing recalculation
+        by_usage_key = metrics.by_usage_key
         usage_entries = metrics_dict.get("by_usage_key", [])
         if isinstance(usage_entries, list):
             for entry in usage_entries:
@@ -100,12 +99,7 @@ def load_metrics_from_snapshot(snapshot: dict) -> Optional[Metrics]:
                 model_id = entry.get("model_id")
                 if not region or not identity or not model_id:
                     continue
-                metrics.by_usage_key[(region, identity, model_id)] = TokenStats(
-                    input_tokens=entry.get("input_tokens", 0),
-                    output_tokens=entry.get("output_tokens", 0),
-                    total_tokens=entry.get("total_tokens", 0),
-                    cost_usd=entry.get("cost_usd", 0.0),
-                )
+                by_usage_key[(region, identity, model_id)] = to_stats(entry)
         elif isinstance(usage_entries, dict):
             for key, stats_dict in usage_entries.items():
                 if not isinstance(stats_dict, dict):
@@ -116,12 +110,7 @@ def load_metrics_from_snapshot(snapshot: dict) -> Optional[Metrics]:
                 if len(parts) != 3:
                     continue
                 region, identity, model_id = parts
-                metrics.by_usage_key[(region, identity, model_id)] = TokenStats(
-                    input_tokens=stats_dict.get("input_tokens", 0),
-                    output_tokens=stats_dict.get("output_tokens", 0),
-                    total_tokens=stats_dict.get("total_tokens", 0),
-                    cost_usd=stats_dict.get("cost_usd", 0.0),
-                )
+                by_usage_key[(region, identity, model_id)] = to_stats(stats_dict)
 
         return metrics
     except Exception:
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
 import requests
 
+from ..json_utils import dump_json
+
 
 class SlackAdapter:
     def post_message(self, text: str, blocks: Optional[List[Dict[str, Any]]] = None) -> None:
@@ -16,6 +18,10 @@ class SlackWebhookAdapter(SlackAdapter):
     webhook_url: str
     channel: Optional[str] = None
     username: Optional[str] = None
+    _session: requests.Session = field(default_factory=requests.Session, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._session.headers["Content-Type"] = "application/json"
 
     def post_message(self, text: str, blocks: Optional[List[Dict[str, Any]]] = None) -> None:
         payload: Dict[str, Any] = {"text": text}
@@ -25,7 +31,8 @@ class SlackWebhookAdapter(SlackAdapter):
             payload["channel"] = self.channel
         if self.username:
             payload["username"] = self.username
-        response = requests.post(self.webhook_url, json=payload, timeout=10)
+        # Reuse the pooled session so repeated posts keep the HTTPS connection alive
+        response = self._session.post(self.webhook_url, data=dump_json(payload), timeout=10)
         response.raise_for_status()
 
         # Slack webhooks return "ok" on success, error message on failure
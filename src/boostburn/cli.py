@@ -1,24 +1,28 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import logging
 import os
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-import boto3
-
-from .adapters.aws_s3 import AwsS3Adapter
-from .adapters.pricing import StaticPricingProvider
-from .adapters.report_store import ReportStore
-from .adapters.slack import SlackWebhookAdapter
 from .env import load_dotenv
-from .graph.workflow import Dependencies, RunConfig, build_graph
+
+if TYPE_CHECKING:
+    import boto3
+
+    from .adapters.slack import SlackWebhookAdapter
+
+# boto3, langgraph and the graph adapters are imported inside the branches that use
+# them so `--help` and `--test-slack` don't pay their import cost.
 
 
 def _create_slack_adapter() -> Optional[SlackWebhookAdapter]:
     """Create Slack adapter from environment variables."""
+    from .adapters.slack import SlackWebhookAdapter
+
     webhook_url = os.getenv("SLACK_WEBHOOK_URL")
     if not webhook_url:
         return None
@@ -73,7 +77,13 @@ def main() -> None:
 
         return
 
-    _ensure_aws_credentials()
+    session = _aws_session()
+    _ensure_aws_credentials(session)
+
+    from .adapters.aws_s3 import AwsS3Adapter
+    from .adapters.pricing import StaticPricingProvider
+    from .adapters.report_store import ReportStore
+    from .graph.workflow import Dependencies, RunConfig, build_graph
 
     slack_adapter = _create_slack_adapter()
 
@@ -88,7 +98,7 @@ def main() -> None:
         )
 
     deps = Dependencies(
-        s3=AwsS3Adapter(),
+        s3=AwsS3Adapter(session=session),
         pricing=StaticPricingProvider(pricing_path=pricing_path),
         report_store=report_store,
         slack=slack_adapter,
@@ -106,11 +116,21 @@ def main() -> None:
         force_reprocess=args.force_reprocess,
     )
     graph = build_graph(deps, run_config)
-    graph.invoke({})
+    try:
+        graph.invoke({})
+    finally:
+        report_store.close()
+
+
+@functools.lru_cache(maxsize=1)
+def _aws_session() -> boto3.Session:
+    """Create the boto3 session once; credential checks and the S3 client share it."""
+    import boto3
+
+    return boto3.Session()
 
 
-def _ensure_aws_credentials() -> None:
-    session = boto3.Session()
+def _ensure_aws_credentials(session: boto3.Session) -> None:
     credentials = session.get_credentials()
     if credentials is None:
         raise SystemExit(
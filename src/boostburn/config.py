@@ -5,7 +5,9 @@ import re
 from pathlib import Path
 from typing import Dict, Optional
 
-import yaml
+from .yaml_utils import load_yaml
+
+_ACCOUNT_ID_PATTERN = re.compile(r"\b(\d{12})\b")
 
 
 @dataclass(frozen=True)
@@ -27,7 +29,7 @@ def _normalize_bucket_name(value: str) -> str:
 def _derive_account_id(buckets: Dict[str, str]) -> Optional[str]:
     ids = set()
     for name in buckets.values():
-        match = re.search(r"\b(\d{12})\b", name)
+        match = _ACCOUNT_ID_PATTERN.search(name)
         if match:
             ids.add(match.group(1))
     if len(ids) == 1:
@@ -36,7 +38,8 @@ def _derive_account_id(buckets: Dict[str, str]) -> Optional[str]:
 
 
 def load_config(path: str | Path) -> AppConfig:
-    data = yaml.safe_load(Path(path).read_text())
+    with Path(path).open("rb") as handle:
+        data = load_yaml(handle)
     if not isinstance(data, dict) or "regions" not in data:
         raise ValueError("Config must contain a 'regions' mapping")
     regions_raw = data["regions"]
@@ -2,25 +2,30 @@ from __future__ import annotations
 
 from pathlib import Path
 import os
+import re
+
+# One KEY=value assignment per line: a double- or single-quoted value is taken verbatim,
+# an unquoted value runs up to an inline "#" comment; anything else is skipped.
+_DOTENV_PATTERN = re.compile(
+    r"""^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*"""
+    r"""(?:"((?:[^"\\\r\n]|\\.)*)"|'([^'\r\n]*)'|([^#\r\n]*?))"""
+    r"""[ \t]*(?:#[^\r\n]*)?\r?$""",
+    re.MULTILINE,
+)
 
 
 def load_dotenv(path: Path) -> None:
-    if not path.exists():
+    try:
+        text = path.read_text(encoding="utf-8")
+    except FileNotFoundError:
         return
-    for raw in path.read_text(encoding="utf-8").splitlines():
-        line = raw.strip()
-        if not line or line.startswith("#"):
-            continue
-        if "=" not in line:
-            continue
-        key, value = line.split("=", 1)
-        key = key.strip()
-        value = value.strip()
-        if not key:
-            continue
-        if value and value[0] in ("'", '"') and value[-1] == value[0]:
-            value = value[1:-1]
-        elif "#" in value:
-            value = value.split("#", 1)[0].rstrip()
-        if key not in os.environ:
-            os.environ[key] = value
+    setdefault = os.environ.setdefault
+    for match in _DOTENV_PATTERN.finditer(text):
+        key, double_quoted, single_quoted, bare = match.groups()
+        if double_quoted is not None:
+            value = double_quoted
+        elif single_quoted is not None:
+            value = single_quoted
+        else:
+            value = bare
+        setdefault(key, value)
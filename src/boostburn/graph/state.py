@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional, TypedDict
+from typing import Any, Dict, List, Optional, Tuple, TypedDict
 
 from ..config import AppConfig
 from ..models import Metrics, Warnings
@@ -16,7 +16,6 @@ class GraphState(TypedDict, total=False):
     report_end: datetime
     regions: List[str]
     buckets: Dict[str, str]
-    region_index: int
     current_region: Optional[str]
     current_bucket: Optional[str]
     current_manifest: ManifestState
@@ -30,7 +29,7 @@ class GraphState(TypedDict, total=False):
     stats: Dict[str, Any]
     report_message: str
     report_snapshot: Dict[str, object]
-    report_generated_at: datetime
+    report_iso_times: Tuple[str, str, str]  # UTC ISO (report_start, report_end, generated_at)
     report_snapshot_path: Optional[str]
     csv_report_path: Optional[str]
     slack_message: Optional[str]
@@ -1,29 +1,24 @@
 from __future__ import annotations
 
-import json
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor
 import re
 from dataclasses import dataclass, replace
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
-from typing import Callable, List, Optional
-
-from langgraph.graph import END, StateGraph
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple, TypeVar
 
 from ..adapters.aws_s3 import S3Adapter, S3Object
 from ..adapters.pricing import PricingProvider
 from ..adapters.report_store import ReportStore
 from ..adapters.slack import SlackAdapter, SlackWebhookAdapter
 from ..config import AppConfig, load_config
-from ..ingest.bedrock_parser import (
-    _maybe_decompress,
-    extract_token_counts,
-    normalize_model_id,
-    parse_bedrock_records,
-    parse_timestamp,
-)
+from ..ingest.aggregate import aggregate_records
+from ..ingest.bedrock_parser import parse_bedrock_payload, read_log_payload
+from ..json_utils import dump_json
 from ..logging_utils import log_event
 from ..models import Metrics, TokenStats, Warnings
-from ..reporting import CSV_FIELDS, build_csv_row, build_report_snapshot, format_report
+from ..reporting import CSV_FIELDS, build_csv_row, build_report_snapshot, format_report, iso_times
 from ..state.manifest import (
     ManifestState,
     load_manifest,
@@ -34,6 +29,21 @@ from ..state.manifest import (
 )
 from .state import GraphState
 
+# Upper bound on regions scanned concurrently; the per-region work is S3 I/O bound
+_MAX_REGION_WORKERS = 8
+
+# Log objects fetched concurrently within one region; results are consumed in listing order
+_MAX_FETCH_WORKERS = 4
+
+# "00/" .. "23/" hour segments of a log prefix
+_HOUR_SEGMENTS = tuple(f"{hour:02d}/" for hour in range(24))
+
+# Timestamp-prefixed metadata files: 20260201T204541Z_hash.json(.gz)
+_METADATA_FILE_PATTERN = re.compile(r"\d{8}T\d{6,9}Z_[a-f0-9]+\.json(?:\.gz)?\Z")
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
 
 @dataclass(frozen=True)
 class Dependencies:
@@ -57,13 +67,17 @@ class RunConfig:
 
 
 def build_graph(deps: Dependencies, run_config: RunConfig):
+    from langgraph.graph import END, StateGraph
+
     def load_config_node(state: GraphState) -> GraphState:
         config = load_config(run_config.config_path)
         if run_config.log_prefix_override is not None:
             config = replace(config, log_prefix=run_config.log_prefix_override.strip("/"))
         now = run_config.now_fn()
         report_date = run_config.report_date or now.date().isoformat()
-        report_start = datetime.fromisoformat(report_date).replace(tzinfo=timezone.utc)
+        # Build the tz-aware midnight directly; date.fromisoformat still validates the input
+        day = date.fromisoformat(report_date)
+        report_start = datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
         report_end = report_start + timedelta(days=1)
         regions = list(config.regions.keys())
         state.update(
@@ -74,34 +88,54 @@ def build_graph(deps: Dependencies, run_config: RunConfig):
                 "report_end": report_end,
                 "regions": regions,
                 "buckets": config.regions,
-                "region_index": 0,
                 "metrics": Metrics(),
                 "warnings": Warnings(),
-                "stats": {
-                    "objects_listed": 0,
-                    "objects_filtered": 0,
-                    "objects_processed": 0,
-                    "records_parsed": 0,
-                    "records_used": 0,
-                },
+                "stats": _new_scan_stats(),
             }
         )
         log_event(deps.logger, "load_config", regions=len(regions), report_date=report_date)
         return state
 
-    def region_router(state: GraphState) -> GraphState:
-        index = state["region_index"]
+    def scan_regions_node(state: GraphState) -> GraphState:
         regions = state["regions"]
-        if index < len(regions):
-            region = regions[index]
-            state["current_region"] = region
-            state["current_bucket"] = state["buckets"][region]
+
+        def scan_region(region: str) -> GraphState:
+            # Each region works on its own slice; results are merged after the join
+            return region_graph.invoke(
+                {
+                    "config": state["config"],
+                    "report_start": state["report_start"],
+                    "report_end": state["report_end"],
+                    "current_region": region,
+                    "current_bucket": state["buckets"][region],
+                    "metrics": Metrics(),
+                    "warnings": Warnings(),
+                    "stats": _new_scan_stats(),
+                }
+            )
+
+        max_workers = max(1, min(_MAX_REGION_WORKERS, len(regions)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(scan_region, regions))
+
+        # Merge in region order so model_id_map keeps the same first occurrence as a serial scan
+        stats = state["stats"]
+        for region_state in results:
+            state["metrics"].merge(region_state["metrics"])
+            state["warnings"].merge(region_state["warnings"])
+            for name, value in region_state["stats"].items():
+                stats[name] += value
+        log_event(deps.logger, "scan_regions", regions=len(regions), workers=max_workers)
         return state
 
     def refresh_pricing_node(state: GraphState) -> GraphState:
         # Use original model IDs (with inference profile prefixes) for pricing filter
         metrics = state["metrics"]
-        model_ids = {metrics.model_id_map.get(norm_id, norm_id) for norm_id in metrics.by_model.keys()}
+        # Every model_id_map key is also a by_model key, so take the mapped originals wholesale
+        # and add only the models that were never mapped
+        model_id_map = metrics.model_id_map
+        model_ids = set(model_id_map.values())
+        model_ids.update(norm_id for norm_id in metrics.by_model if norm_id not in model_id_map)
         if model_ids:
             deps.pricing.refresh(model_ids=model_ids)
             log_event(deps.logger, "refresh_pricing", models=len(model_ids))
@@ -116,13 +150,25 @@ def build_graph(deps: Dependencies, run_config: RunConfig):
 
     def load_manifest_node(state: GraphState) -> GraphState:
         bucket = state["current_bucket"]
-        manifest_key = _manifest_key(run_config.manifest_prefix)
+        region = state["current_region"]
+        manifest_key = _manifest_key(run_config.manifest_prefix, region)
         manifest, etag = load_manifest(
             deps.s3,
             bucket,
             manifest_key,
             lookback_hours=run_config.lookback_hours,
         )
+        if etag is None:
+            # No per-region manifest yet: seed it from the older per-bucket manifest, keeping
+            # only this region's keys, so an upgrade does not reprocess the lookback window
+            legacy_key = _legacy_manifest_key(run_config.manifest_prefix)
+            legacy, legacy_etag = load_manifest(deps.s3, bucket, legacy_key, lookback_hours=run_config.lookback_hours)
+            if legacy_etag is not None:
+                head = _log_prefix_head(state["config"], region)
+                legacy.processed = {key: meta for key, meta in legacy.processed.items() if key.startswith(head)}
+                manifest = legacy
+                log_event(deps.logger, "migrate_manifest", bucket=bucket, legacy_key=legacy_key,
+                          processed=len(manifest.processed))
         manifest.lookback_hours = run_config.lookback_hours
         state["current_manifest"] = manifest
         state["current_manifest_etag"] = etag
@@ -149,11 +195,8 @@ def build_graph(deps: Dependencies, run_config: RunConfig):
         start_dt = start_dt.replace(minute=0, second=0, microsecond=0)
         end_hour = report_end.replace(minute=0, second=0, microsecond=0)
 
-        prefixes: List[str] = []
-        current = start_dt
-        while current <= end_hour:
-            prefixes.append(_build_log_prefix(config, region, current))
-            current += timedelta(hours=1)
+        hour_count = max(0, (end_hour - start_dt) // timedelta(hours=1) + 1)
+        prefixes = _hourly_prefixes(_log_prefix_head(config, region), start_dt, hour_count)
 
         # Cap scan_end_datehour at current time to avoid claiming we've scanned
         # future hours. This ensures subsequent runs correctly compute lookback_start.
@@ -169,30 +212,32 @@ def build_graph(deps: Dependencies, run_config: RunConfig):
     def list_objects_node(state: GraphState) -> GraphState:
         bucket = state["current_bucket"]
         prefixes = state.get("scan_prefixes", [])
+        stats = state["stats"]
+        list_objects = deps.s3.list_objects
+        is_metadata_file = _is_metadata_file
         objects: List[S3Object] = []
+        listed = 0
         for prefix in prefixes:
-            found = deps.s3.list_objects(bucket, prefix)
-            state["stats"]["objects_listed"] += len(found)
+            found = list_objects(bucket, prefix)
+            listed += len(found)
             # Filter to only metadata files (skip input/output body files)
-            metadata_files = [obj for obj in found if _is_metadata_file(obj.key)]
-            state["stats"]["objects_filtered"] += len(found) - len(metadata_files)
-            objects.extend(metadata_files)
+            objects.extend([obj for obj in found if is_metadata_file(obj.key)])
+        stats["objects_listed"] += listed
+        stats["objects_filtered"] += listed - len(objects)
         state["objects"] = objects
-        log_event(deps.logger, "list_objects", bucket=bucket, total=state["stats"]["objects_listed"], metadata=len(objects))
+        log_event(deps.logger, "list_objects", bucket=bucket, total=stats["objects_listed"], metadata=len(objects))
         return state
 
     def filter_new_objects_node(state: GraphState) -> GraphState:
         manifest: ManifestState = state["current_manifest"]
-        processed = manifest.processed
-        new_objects: List[S3Object] = []
-        for obj in state.get("objects", []):
+        objects = state.get("objects", [])
+        if run_config.force_reprocess:
             # Force reprocess: treat all objects as new
-            if run_config.force_reprocess:
-                new_objects.append(obj)
-                continue
-            meta = processed.get(obj.key)
-            if not meta or meta.get("etag") != obj.etag:
-                new_objects.append(obj)
+            new_objects = list(objects)
+        else:
+            etag_by_key = {key: meta.get("etag") for key, meta in manifest.processed.items()}
+            get_etag = etag_by_key.get
+            new_objects = [obj for obj in objects if get_etag(obj.key) != obj.etag]
         state["new_objects"] = new_objects
         log_event(deps.logger, "filter_new_objects", new=len(new_objects), force=run_config.force_reprocess)
         return state
@@ -207,78 +252,83 @@ def build_graph(deps: Dependencies, run_config: RunConfig):
         manifest: ManifestState = state["current_manifest"]
         now = run_config.now_fn()
 
-        for obj in state.get("new_objects", []):
-            raw = deps.s3.get_object_bytes(bucket, obj.key)
-
-            # Debug mode: dump raw logs (decompressed) mirroring S3 structure
-            if run_config.debug:
-                debug_path = Path("debug") / bucket / obj.key
-                # Remove .gz extension if present, always write as .json
-                if debug_path.suffix == ".gz":
-                    debug_path = debug_path.with_suffix("")
-                if not debug_path.suffix:
-                    debug_path = debug_path.with_suffix(".json")
-                debug_path.parent.mkdir(parents=True, exist_ok=True)
-                decompressed = _maybe_decompress(raw, obj.key)
-                debug_path.write_bytes(decompressed)
-
-            records = parse_bedrock_records(raw, obj.key)
-            state["stats"]["objects_processed"] += 1
-            for record in records:
-                state["stats"]["records_parsed"] += 1
-                timestamp = parse_timestamp(record)
-                if timestamp is None:
-                    warnings.records_skipped += 1
-                    # Debug mode: log skipped records with full content
-                    if run_config.debug:
-                        skipped_path = Path("debug/skipped_records.jsonl")
-                        skipped_path.parent.mkdir(parents=True, exist_ok=True)
-                        with open(skipped_path, "a") as f:
-                            f.write(json.dumps({
-                                "reason": "no_timestamp",
-                                "bucket": bucket,
-                                "key": obj.key,
-                                "record": record,
-                            }) + "\n")
-                    continue
-                if not (report_start <= timestamp < report_end):
-                    continue
-                input_tokens, output_tokens, used_fallback = extract_token_counts(record)
-                if used_fallback or (input_tokens == 0 and output_tokens == 0):
-                    warnings.missing_token_counts += 1
-                original_model_id = record.get("modelId") or "unknown"
-                model_id = normalize_model_id(original_model_id)
-                identity = record.get("identity", {}).get("arn") or "unknown"
-                record_region = record.get("region") or region
-                metrics.add_usage(
-                    region=record_region,
-                    identity=identity,
-                    model_id=model_id,
-                    input_tokens=input_tokens,
-                    output_tokens=output_tokens,
-                    cost_usd=0.0,
-                    original_model_id=original_model_id,
+        # Counters are kept in locals and written back once at the end
+        stats = state["stats"]
+        objects_processed = 0
+        records_parsed = 0
+        records_used = 0
+        records_skipped = 0
+        missing_token_counts = 0
+        debug = run_config.debug
+        skipped_lines: List[bytes] = []
+        new_objects = state.get("new_objects", [])
+
+        def fetch(obj: S3Object) -> Tuple[S3Object, bytes, List[dict]]:
+            # Stream the body through the gzip decoder rather than holding compressed and decompressed copies
+            with deps.s3.get_object_stream(bucket, obj.key) as body:
+                payload = read_log_payload(body, obj.key)
+            return obj, payload, parse_bedrock_payload(payload)
+
+        # Objects are fetched and parsed on worker threads so S3 round-trips overlap;
+        # aggregation stays on this thread, in listing order
+        workers = max(1, min(_MAX_FETCH_WORKERS, len(new_objects)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for obj, payload, records in _map_ordered(executor, fetch, new_objects, window=workers * 2):
+                # Debug mode: dump raw logs (decompressed) mirroring S3 structure
+                if debug:
+                    debug_path = Path("debug") / bucket / obj.key
+                    # Remove .gz extension if present, always write as .json
+                    if debug_path.suffix == ".gz":
+                        debug_path = debug_path.with_suffix("")
+                    if not debug_path.suffix:
+                        debug_path = debug_path.with_suffix(".json")
+                    debug_path.parent.mkdir(parents=True, exist_ok=True)
+                    debug_path.write_bytes(payload)
+
+                objects_processed += 1
+                records_parsed += len(records)
+                skipped: Optional[List[dict]] = [] if debug else None
+                counts = aggregate_records(
+                    records,
+                    region=region,
+                    report_start=report_start,
+                    report_end=report_end,
+                    metrics=metrics,
+                    skipped=skipped,
                 )
-                state["stats"]["records_used"] += 1
-            record_processed(manifest, obj.key, obj.etag, now)
-
-        log_event(deps.logger, "ingest_objects", processed=len(state.get("new_objects", [])))
+                records_used += counts.records_used
+                records_skipped += counts.records_skipped
+                missing_token_counts += counts.missing_token_counts
+                # Debug mode: log skipped records with full content
+                if skipped:
+                    skipped_lines.extend(
+                        dump_json({"reason": "no_timestamp", "bucket": bucket, "key": obj.key, "record": record}) + b"\n"
+                        for record in skipped
+                    )
+                record_processed(manifest, obj.key, obj.etag, now)
+
+        stats["objects_processed"] += objects_processed
+        stats["records_parsed"] += records_parsed
+        stats["records_used"] += records_used
+        warnings.records_skipped += records_skipped
+        warnings.missing_token_counts += missing_token_counts
+        if skipped_lines:
+            _append_skipped_records(skipped_lines)
+        log_event(deps.logger, "ingest_objects", processed=len(new_objects))
         return state
 
     def update_manifest_node(state: GraphState) -> GraphState:
         bucket = state["current_bucket"]
         manifest: ManifestState = state["current_manifest"]
         update_last_datehour(manifest, state.get("scan_end_datehour"))
-        prune_manifest(manifest, run_config.now_fn())
-        manifest_key = _manifest_key(run_config.manifest_prefix)
-        save_manifest(deps.s3, bucket, manifest_key, manifest)
+        # One clock read for both pruning and the manifest's updated_at
+        now = run_config.now_fn()
+        prune_manifest(manifest, now)
+        manifest_key = _manifest_key(run_config.manifest_prefix, state["current_region"])
+        save_manifest(deps.s3, bucket, manifest_key, manifest, now)
         log_event(deps.logger, "update_manifest", bucket=bucket, manifest_key=manifest_key)
         return state
 
-    def advance_region_node(state: GraphState) -> GraphState:
-        state["region_index"] += 1
-        return state
-
     def verify_results_node(state: GraphState) -> GraphState:
         metrics: Metrics = state["metrics"]
         warnings: Warnings = state["warnings"]
@@ -319,17 +369,13 @@ def build_graph(deps: Dependencies, run_config: RunConfig):
 
     def render_report_node(state: GraphState) -> GraphState:
         report_date = state["report_date"]
-        report_start = state["report_start"]
-        report_end = state["report_end"]
         metrics = state["metrics"]
         warnings = state["warnings"]
-        generated_at = run_config.now_fn()
+        report_iso_times = iso_times(state["report_start"], state["report_end"], run_config.now_fn())
         message = format_report(report_date, metrics, warnings)
         snapshot = build_report_snapshot(
             report_date=report_date,
-            report_start=report_start,
-            report_end=report_end,
-            generated_at=generated_at,
+            iso_times=report_iso_times,
             metrics=metrics,
             warnings=warnings,
             stats=state["stats"],
@@ -337,7 +383,7 @@ def build_graph(deps: Dependencies, run_config: RunConfig):
         )
         state["report_message"] = message
         state["report_snapshot"] = snapshot
-        state["report_generated_at"] = generated_at
+        state["report_iso_times"] = report_iso_times
         log_event(deps.logger, "render_report", report_date=report_date)
         return state
 
@@ -383,12 +429,9 @@ def build_graph(deps: Dependencies, run_config: RunConfig):
         return state
 
     def append_csv_node(state: GraphState) -> GraphState:
-        generated_at = state["report_generated_at"]
         row = build_csv_row(
             report_date=state["report_date"],
-            report_start=state["report_start"],
-            report_end=state["report_end"],
-            generated_at=generated_at,
+            iso_times=state["report_iso_times"],
             metrics=state["metrics"],
             warnings=state["warnings"],
             stats=state["stats"],
@@ -404,17 +447,29 @@ def build_graph(deps: Dependencies, run_config: RunConfig):
             return "ingest_objects"
         return "update_manifest"
 
+    region_graph = StateGraph(GraphState)
+    region_graph.add_node("load_manifest", load_manifest_node)
+    region_graph.add_node("plan_scan", plan_scan_node)
+    region_graph.add_node("list_objects", list_objects_node)
+    region_graph.add_node("filter_new_objects", filter_new_objects_node)
+    region_graph.add_node("ingest_objects", ingest_objects_node)
+    region_graph.add_node("update_manifest", update_manifest_node)
+
+    region_graph.set_entry_point("load_manifest")
+    region_graph.add_edge("load_manifest", "plan_scan")
+    region_graph.add_edge("plan_scan", "list_objects")
+    region_graph.add_edge("list_objects", "filter_new_objects")
+    # Declare both destinations up front so the branch is resolved when the graph compiles
+    region_graph.add_conditional_edges("filter_new_objects", has_new_objects, ["ingest_objects", "update_manifest"])
+    region_graph.add_edge("ingest_objects", "update_manifest")
+    region_graph.add_edge("update_manifest", END)
+    region_graph = region_graph.compile()
+
     graph = StateGraph(GraphState)
     graph.add_node("load_config", load_config_node)
+    graph.add_node("scan_regions", scan_regions_node)
     graph.add_node("refresh_pricing", refresh_pricing_node)
     graph.add_node("apply_pricing", apply_pricing_node)
-    graph.add_node("load_manifest", load_manifest_node)
-    graph.add_node("plan_scan", plan_scan_node)
-    graph.add_node("list_objects", list_objects_node)
-    graph.add_node("filter_new_objects", filter_new_objects_node)
-    graph.add_node("ingest_objects", ingest_objects_node)
-    graph.add_node("update_manifest", update_manifest_node)
-    graph.add_node("advance_region", advance_region_node)
     graph.add_node("verify_results", verify_results_node)
     graph.add_node("render_report", render_report_node)
     graph.add_node("load_snapshot", load_snapshot_node)
@@ -422,22 +477,9 @@ def build_graph(deps: Dependencies, run_config: RunConfig):
     graph.add_node("append_csv", append_csv_node)
     graph.add_node("post_report", post_report_node)
 
-    graph.add_node("region_router", region_router)
     graph.set_entry_point("load_config")
-    graph.add_edge("load_config", "region_router")
-
-    graph.add_edge("load_manifest", "plan_scan")
-    graph.add_edge("plan_scan", "list_objects")
-    graph.add_edge("list_objects", "filter_new_objects")
-    graph.add_conditional_edges("filter_new_objects", has_new_objects)
-    graph.add_edge("ingest_objects", "update_manifest")
-    graph.add_edge("update_manifest", "advance_region")
-    graph.add_edge("advance_region", "region_router")
-
-    graph.add_conditional_edges(
-        "region_router",
-        lambda state: "load_manifest" if state["region_index"] < len(state["regions"]) else "load_snapshot",
-    )
+    graph.add_edge("load_config", "scan_regions")
+    graph.add_edge("scan_regions", "load_snapshot")
     graph.add_edge("load_snapshot", "refresh_pricing")
     graph.add_edge("refresh_pricing", "apply_pricing")
     graph.add_edge("apply_pricing", "verify_results")
@@ -450,27 +492,56 @@ def build_graph(deps: Dependencies, run_config: RunConfig):
     return graph.compile()
 
 
-def _manifest_key(prefix: str) -> str:
+def _new_scan_stats() -> dict:
+    return {
+        "objects_listed": 0,
+        "objects_filtered": 0,
+        "objects_processed": 0,
+        "records_parsed": 0,
+        "records_used": 0,
+    }
+
+
+def _manifest_key(prefix: str, region: str) -> str:
+    # Keyed per region: regions may share a bucket and are scanned concurrently, so a
+    # shared manifest (and its last_datehour) would be overwritten by whichever finished last
+    clean = prefix.strip("/")
+    key = f"bedrock-usage/{region}/manifest.json"
+    return f"{clean}/{key}" if clean else key
+
+
+def _legacy_manifest_key(prefix: str) -> str:
+    # Per-bucket manifest written by earlier versions; only read to seed per-region manifests
     clean = prefix.strip("/")
     return f"{clean}/bedrock-usage/manifest.json" if clean else "bedrock-usage/manifest.json"
 
 
-def _build_log_prefix(config: AppConfig, region: str, datehour: datetime) -> str:
-    parts: List[str] = []
-    if config.log_prefix:
-        parts.append(config.log_prefix)
-    parts.append("AWSLogs")
-    if config.account_id:
-        parts.append(config.account_id)
-    parts.append("BedrockModelInvocationLogs")
-    parts.append(region)
-    parts.append(datehour.strftime("%Y/%m/%d/%H"))
-    return "/".join(parts) + "/"
+def _log_prefix_head(config: AppConfig, region: str) -> str:
+    parts = (config.log_prefix, "AWSLogs", config.account_id, "BedrockModelInvocationLogs", region)
+    return "/".join(part for part in parts if part) + "/"
+
+
+def _hourly_prefixes(head: str, start: datetime, hour_count: int) -> List[str]:
+    # Format the date once per day and append the precomputed hour segments
+    prefixes: List[str] = []
+    day = start
+    hour = start.hour
+    while hour_count > 0:
+        day_head = f"{head}{day:%Y/%m/%d}/"
+        take = min(24 - hour, hour_count)
+        prefixes.extend([day_head + segment for segment in _HOUR_SEGMENTS[hour:hour + take]])
+        hour_count -= take
+        hour = 0
+        day += timedelta(days=1)
+    return prefixes
 
 
 def _parse_datehour(value: str) -> Optional[datetime]:
+    # Fixed "%Y-%m-%dT%H" layout; slice it directly instead of going through strptime
+    if len(value) != 13 or value[4] != "-" or value[7] != "-" or value[10] != "T":
+        return None
     try:
-        return datetime.strptime(value, "%Y-%m-%dT%H").replace(tzinfo=timezone.utc)
+        return datetime(int(value[0:4]), int(value[5:7]), int(value[8:10]), int(value[11:13]), tzinfo=timezone.utc)
     except ValueError:
         return None
 
@@ -492,6 +563,28 @@ def _stats_equal(left: TokenStats, right: TokenStats) -> bool:
     return abs(left.cost_usd - right.cost_usd) < 0.0001
 
 
+def _append_skipped_records(lines: List[bytes]) -> None:
+    # One append per region keeps lines whole when regions are ingested concurrently
+    skipped_path = Path("debug/skipped_records.jsonl")
+    skipped_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(skipped_path, "ab", buffering=0) as handle:
+        handle.write(b"".join(lines))
+
+
+def _map_ordered(executor: Executor, fn: Callable[[_T], _R], items: Iterable[_T], window: int) -> Iterator[_R]:
+    """Like executor.map, but with at most ``window`` calls submitted ahead of the consumer.
+
+    executor.map submits every item up front, which would hold every fetched payload in memory.
+    """
+    pending: deque = deque()
+    for item in items:
+        if len(pending) >= window:
+            yield pending.popleft().result()
+        pending.append(executor.submit(fn, item))
+    while pending:
+        yield pending.popleft().result()
+
+
 def _is_metadata_file(key: str) -> bool:
     """Return True if this is a Bedrock metadata file (not input/output body).
 
@@ -503,12 +596,9 @@ def _is_metadata_file(key: str) -> bool:
 
     Only metadata files contain the fields needed for usage tracking.
     """
-    basename = key.rsplit("/", 1)[-1]
-    # Skip input/output body files
-    if "_input.json" in basename or "_output.json" in basename:
-        return False
-    # Skip permission check files
-    if basename.startswith("amazon-bedrock-logs-permission-check"):
+    basename = key[key.rfind("/") + 1:]
+    # Cheap structural check on the timestamp prefix (YYYYMMDDT + 6-9 digits + Z_) rejects
+    # body and permission-check files without running the regex
+    if len(basename) < 23 or basename[8] != "T" or "Z" not in basename[15:19]:
         return False
-    # Match timestamp-prefixed metadata files: 20260201T204541Z_hash.json(.gz)
-    return bool(re.match(r"^\d{8}T\d{6,9}Z_[a-f0-9]+\.json(\.gz)?$", basename))
+    return _METADATA_FILE_PATTERN.match(basename) is not None
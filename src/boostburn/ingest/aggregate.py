@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ..models import Metrics
+from .bedrock_parser import extract_token_counts, normalize_model_id, parse_timestamp
+
+
+@dataclass(slots=True)
+class AggregateCounts:
+    records_used: int = 0
+    records_skipped: int = 0
+    missing_token_counts: int = 0
+
+
+def aggregate_records(
+    records: Iterable[Dict[str, Any]],
+    *,
+    region: str,
+    report_start: datetime,
+    report_end: datetime,
+    metrics: Metrics,
+    skipped: Optional[List[Dict[str, Any]]] = None,
+) -> AggregateCounts:
+    """Add the usage of every record inside [report_start, report_end) to metrics.
+
+    Records without a timestamp are counted as skipped and, when a ``skipped`` list
+    is given, appended to it. This is the per-record hot loop of ingestion, so every
+    global and attribute it touches is bound to a local first.
+
+    Token counts are summed per (region, identity, model) key in a local dict and
+    added to ``metrics`` once per key, in first-seen order, so Metrics.model_id_map
+    keeps the same first occurrence as per-record updates would.
+    """
+    # (region, identity, model_id) -> [input_tokens, output_tokens, first original model id]
+    usage: Dict[Tuple[str, str, str], List[Any]] = {}
+    get_timestamp = parse_timestamp
+    get_tokens = extract_token_counts
+    normalize = normalize_model_id
+    records_used = 0
+    records_skipped = 0
+    missing_token_counts = 0
+    for record in records:
+        timestamp = get_timestamp(record)
+        if timestamp is None:
+            records_skipped += 1
+            if skipped is not None:
+                skipped.append(record)
+            continue
+        if not (report_start <= timestamp < report_end):
+            continue
+        input_tokens, output_tokens, used_fallback = get_tokens(record)
+        if used_fallback or (input_tokens == 0 and output_tokens == 0):
+            missing_token_counts += 1
+        original_model_id = record.get("modelId") or "unknown"
+        key = (
+            record.get("region") or region,
+            record.get("identity", {}).get("arn") or "unknown",
+            normalize(original_model_id),
+        )
+        entry = usage.get(key)
+        if entry is None:
+            usage[key] = [input_tokens, output_tokens, original_model_id]
+        else:
+            entry[0] += input_tokens
+            entry[1] += output_tokens
+        records_used += 1
+
+    add_usage = metrics.add_usage
+    for (record_region, identity, model_id), (input_tokens, output_tokens, original_model_id) in usage.items():
+        add_usage(
+            region=record_region,
+            identity=identity,
+            model_id=model_id,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            cost_usd=0.0,
+            original_model_id=original_model_id,
+        )
+    return AggregateCounts(records_used, records_skipped, missing_token_counts)
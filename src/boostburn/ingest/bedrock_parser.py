@@ -5,17 +5,24 @@ import io
 import json
 import re
 from datetime import datetime, timezone
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, BinaryIO, Dict, Iterable, List, Optional, Tuple
 
-# Pattern to match inference profile ARNs and extract full profile name (including scope prefix)
+from ..json_utils import load_json
+
+# Inference profile ARNs look like arn:aws:bedrock:<region>:<account>:inference-profile/<scope>.<model>
 # Examples:
 #   arn:aws:bedrock:us-east-2:123456789012:inference-profile/us.anthropic.claude-opus-4-5-20251101-v1:0
 #   arn:aws:bedrock:us-east-2:123456789012:inference-profile/global.anthropic.claude-3-5-sonnet-20241022-v2:0
-_INFERENCE_PROFILE_PATTERN = re.compile(
-    r"^arn:aws:bedrock:[^:]+:[^:]+:inference-profile/((us|eu|global|apac)\..+)$"
-)
+_BEDROCK_ARN_PREFIX = "arn:aws:bedrock:"
+_INFERENCE_PROFILE_RESOURCE = "inference-profile/"
+_INFERENCE_PROFILE_SCOPES = ("us.", "eu.", "global.", "apac.")
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_NON_WHITESPACE_PATTERN = re.compile(rb"\S")
 
 
+@lru_cache(maxsize=4096)
 def normalize_model_id(model_id: str) -> str:
     """Normalize model ID to canonical form for aggregation.
 
@@ -35,11 +42,7 @@ def normalize_model_id(model_id: str) -> str:
         anthropic.claude-3-haiku-20240307-v1:0
         -> anthropic.claude-3-haiku-20240307-v1
     """
-    match = _INFERENCE_PROFILE_PATTERN.match(model_id)
-    if match:
-        result = match.group(1)  # Now captures "us.anthropic.model..." with prefix
-    else:
-        result = model_id
+    result = _inference_profile_name(model_id) or model_id
 
     # Strip trailing :X version suffix
     if ":" in result:
@@ -48,31 +51,75 @@ def normalize_model_id(model_id: str) -> str:
     return result
 
 
-def parse_bedrock_records(data: bytes, key: Optional[str] = None) -> List[Dict[str, Any]]:
-    payload = _maybe_decompress(data, key)
-    text = payload.decode("utf-8", errors="replace").strip()
-    if not text:
+def _inference_profile_name(model_id: str) -> Optional[str]:
+    """Return "<scope>.<model>[:X]" from an inference profile ARN, or None for anything else."""
+    # Plain model IDs (the common case) can't be profile ARNs
+    if not model_id.startswith(_BEDROCK_ARN_PREFIX):
+        return None
+    # arn, aws, bedrock, region, account, resource (the resource may itself contain ":")
+    fields = model_id.split(":", 5)
+    if len(fields) != 6 or not fields[3] or not fields[4]:
+        return None
+    resource = fields[5]
+    if not resource.startswith(_INFERENCE_PROFILE_RESOURCE):
+        return None
+    profile = resource[len(_INFERENCE_PROFILE_RESOURCE) :]
+    for scope in _INFERENCE_PROFILE_SCOPES:
+        if profile.startswith(scope) and len(profile) > len(scope):
+            return profile
+    return None
+
+
+def read_log_payload(stream: BinaryIO, key: Optional[str] = None) -> bytes:
+    """Read a log object from a stream, gunzipping it as it is read when compressed."""
+    if key and key.endswith(".gz"):
+        return _gunzip_stream(stream)
+    # Unsuffixed objects may still be gzip; sniff the magic bytes instead of buffering the compressed body
+    head = stream.read(2)
+    if head == _GZIP_MAGIC:
+        return _gunzip_stream(_HeadReplayStream(head, stream))
+    return head + stream.read()
+
+
+def parse_bedrock_records(data: bytes) -> List[Dict[str, Any]]:
+    """Parse raw or already-decompressed log bytes; gzip is detected by its magic bytes."""
+    return parse_bedrock_payload(_maybe_decompress(data))
+
+
+def parse_bedrock_payload(payload: bytes) -> List[Dict[str, Any]]:
+    """Parse an already-decompressed log payload (JSON array, object or NDJSON).
+
+    The bytes go straight to the JSON decoder; they are only decoded to str (with
+    replacement) when orjson rejects them, see load_json.
+    """
+    # Peek at the first non-whitespace byte instead of stripping (and copying) the payload;
+    # the JSON decoders skip surrounding whitespace themselves
+    match = _NON_WHITESPACE_PATTERN.search(payload)
+    if match is None:
         return []
-    first = text.lstrip()[:1]
-    if first == "[":
-        parsed = json.loads(text)
+    first = match.group()
+    if first == b"[":
+        parsed = load_json(payload)
         if isinstance(parsed, list):
             return parsed
         return [parsed]
-    if first == "{":
+    if first == b"{":
         try:
-            return [json.loads(text)]
+            return [load_json(payload)]
         except json.JSONDecodeError:
-            return _parse_json_lines(text)
-    return _parse_json_lines(text)
+            return _parse_json_lines(payload)
+    return _parse_json_lines(payload)
 
 
 def extract_token_counts(record: Dict[str, Any]) -> Tuple[int, int, bool]:
-    input_tokens = _safe_int(record.get("input", {}).get("inputTokenCount"))
-    output_tokens = _safe_int(record.get("output", {}).get("outputTokenCount"))
+    # Look the sections up once and skip the throwaway {} defaults; most records carry both counts
+    input_section = record.get("input")
+    output_section = record.get("output")
+    input_tokens = _safe_int(input_section.get("inputTokenCount")) if input_section else None
+    output_tokens = _safe_int(output_section.get("outputTokenCount")) if output_section else None
     used_fallback = False
     if input_tokens is None or output_tokens is None:
-        usage = _extract_usage(record.get("output", {}).get("outputBodyJson"))
+        usage = _extract_usage(output_section.get("outputBodyJson") if output_section else None)
         if usage:
             if input_tokens is None:
                 input_tokens = _safe_int(usage.get("input_tokens") or usage.get("inputTokens") or usage.get("input_token_count"))
@@ -87,12 +134,15 @@ def parse_timestamp(record: Dict[str, Any]) -> Optional[datetime]:
     if not value:
         return None
     if isinstance(value, str):
-        if value.endswith("Z"):
-            value = value.replace("Z", "+00:00")
+        # fromisoformat parses a trailing "Z" natively (Python 3.11+)
         try:
-            return datetime.fromisoformat(value).astimezone(timezone.utc)
+            parsed = datetime.fromisoformat(value)
         except ValueError:
             return None
+        # Bedrock timestamps are already UTC, so skip the conversion in the common case
+        if parsed.tzinfo is timezone.utc:
+            return parsed
+        return parsed.astimezone(timezone.utc)
     return None
 
 
@@ -105,25 +155,58 @@ def _safe_int(value: Any) -> Optional[int]:
         return None
 
 
-def _parse_json_lines(text: str) -> List[Dict[str, Any]]:
+def _parse_json_lines(data: bytes) -> List[Dict[str, Any]]:
+    # One forward scan for b"\n": no list of every line up front, and unlike a regex
+    # there is no rescanning of long whitespace-only lines
     records: List[Dict[str, Any]] = []
-    for line in text.splitlines():
-        if not line.strip():
-            continue
-        records.append(json.loads(line))
+    size = len(data)
+    start = 0
+    while start < size:
+        end = data.find(b"\n", start)
+        if end == -1:
+            end = size
+        if end > start:
+            line = data[start:end]
+            if not line.isspace():
+                records.append(load_json(line))
+        start = end + 1
     return records
 
 
-def _maybe_decompress(data: bytes, key: Optional[str]) -> bytes:
-    if _is_gzip(data, key):
+def _maybe_decompress(data: bytes) -> bytes:
+    # Trust the magic bytes over the key so decompressed bytes are never gunzipped twice;
+    # startswith compares in place instead of slicing a new bytes object
+    if data.startswith(_GZIP_MAGIC):
         return gzip.decompress(data)
     return data
 
 
-def _is_gzip(data: bytes, key: Optional[str]) -> bool:
-    if key and key.endswith(".gz"):
-        return True
-    return len(data) >= 2 and data[:2] == b"\x1f\x8b"
+def _gunzip_stream(stream: BinaryIO) -> bytes:
+    with gzip.GzipFile(fileobj=stream) as reader:
+        return reader.read()
+
+
+class _HeadReplayStream:
+    """Read-only stream that returns bytes already consumed for sniffing before the rest."""
+
+    __slots__ = ("_head", "_stream")
+
+    def __init__(self, head: bytes, stream: BinaryIO) -> None:
+        self._head = head
+        self._stream = stream
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        head = self._head
+        if not head:
+            return self._stream.read(size)
+        if size is None or size < 0:
+            self._head = b""
+            return head + self._stream.read()
+        if size <= len(head):
+            self._head = head[size:]
+            return head[:size]
+        self._head = b""
+        return head + self._stream.read(size - len(head))
 
 
 def _extract_usage(output_body: Any) -> Optional[Dict[str, Any]]:
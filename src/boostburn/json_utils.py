@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+
+def load_json(data: str | bytes) -> Any:
+    """Parse JSON with orjson when available.
+
+    Falls back to the stdlib decoder, reading bytes as UTF-8 with replacement, so input
+    orjson rejects (lone surrogate escapes, invalid UTF-8) still parses.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    if isinstance(data, bytes):
+        data = data.decode("utf-8", errors="replace")
+    return json.loads(data)
+
+
+def dump_json(
+    data: Any,
+    *,
+    indent: bool = False,
+    sort_keys: bool = False,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> bytes:
+    """Serialize JSON to UTF-8 bytes with orjson when available."""
+    if orjson is not None:
+        option = (orjson.OPT_INDENT_2 if indent else 0) | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(data, default=default, option=option)
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=False, sort_keys=sort_keys, default=default).encode("utf-8")
+    return json.dumps(
+        data, separators=(",", ":"), ensure_ascii=False, sort_keys=sort_keys, default=default
+    ).encode("utf-8")
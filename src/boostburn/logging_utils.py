@@ -1,8 +1,9 @@
-import json
 import logging
 from typing import Any
 
+from .json_utils import dump_json
+
 
 def log_event(logger: logging.Logger, event: str, **fields: Any) -> None:
     payload = {"event": event, **fields}
-    logger.info(json.dumps(payload, default=str, sort_keys=True))
+    logger.info(dump_json(payload, sort_keys=True, default=str).decode("utf-8"))
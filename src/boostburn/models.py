@@ -4,10 +4,10 @@ from dataclasses import dataclass, field
 from typing import Dict, Optional, Set, Tuple
 
 from .metrics.aggregator import compute_cost
-from .adapters.pricing import PricingProvider
+from .adapters.pricing import PriceRate, PricingProvider
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenStats:
     input_tokens: int = 0
     output_tokens: int = 0
@@ -42,11 +42,24 @@ class Metrics:
         original_model_id: Optional[str] = None,
     ) -> None:
         self.totals.add(input_tokens, output_tokens, cost_usd)
-        self.by_region.setdefault(region, TokenStats()).add(input_tokens, output_tokens, cost_usd)
-        self.by_identity.setdefault(identity, TokenStats()).add(input_tokens, output_tokens, cost_usd)
-        self.by_model.setdefault(model_id, TokenStats()).add(input_tokens, output_tokens, cost_usd)
+        # get-then-insert: setdefault would build a throwaway TokenStats on every call
+        stats = self.by_region.get(region)
+        if stats is None:
+            stats = self.by_region[region] = TokenStats()
+        stats.add(input_tokens, output_tokens, cost_usd)
+        stats = self.by_identity.get(identity)
+        if stats is None:
+            stats = self.by_identity[identity] = TokenStats()
+        stats.add(input_tokens, output_tokens, cost_usd)
+        stats = self.by_model.get(model_id)
+        if stats is None:
+            stats = self.by_model[model_id] = TokenStats()
+        stats.add(input_tokens, output_tokens, cost_usd)
         key = (region, identity, model_id)
-        self.by_usage_key.setdefault(key, TokenStats()).add(input_tokens, output_tokens, 0.0)
+        stats = self.by_usage_key.get(key)
+        if stats is None:
+            stats = self.by_usage_key[key] = TokenStats()
+        stats.add(input_tokens, output_tokens, 0.0)
 
         # Track mapping from normalized to original model ID
         if original_model_id and model_id not in self.model_id_map:
@@ -55,7 +68,10 @@ class Metrics:
     def merge(self, other: Metrics) -> Metrics:
         """Merge another Metrics object into this one (additive).
 
-        Used when loading existing snapshots to aggregate multiple runs per day.
+        Used to combine per-region scans and when loading existing snapshots to
+        aggregate multiple runs per day.
+        Existing TokenStats are updated in place; a new TokenStats is allocated
+        only for keys this object has not seen, never shared with ``other``.
         Note: pricing is NOT merged - it will be recalculated by apply_pricing.
         """
         # Merge totals (costs will be recalculated later)
@@ -65,29 +81,11 @@ class Metrics:
             0.0  # Don't merge old costs, will be recalculated
         )
 
-        # Merge by_region
-        for region, stats in other.by_region.items():
-            if region not in self.by_region:
-                self.by_region[region] = TokenStats()
-            self.by_region[region].add(stats.input_tokens, stats.output_tokens, 0.0)
-
-        # Merge by_identity
-        for identity, stats in other.by_identity.items():
-            if identity not in self.by_identity:
-                self.by_identity[identity] = TokenStats()
-            self.by_identity[identity].add(stats.input_tokens, stats.output_tokens, 0.0)
-
-        # Merge by_model
-        for model, stats in other.by_model.items():
-            if model not in self.by_model:
-                self.by_model[model] = TokenStats()
-            self.by_model[model].add(stats.input_tokens, stats.output_tokens, 0.0)
-
-        # Merge by_usage_key (needed for pricing recalculation)
-        for key, stats in other.by_usage_key.items():
-            if key not in self.by_usage_key:
-                self.by_usage_key[key] = TokenStats()
-            self.by_usage_key[key].add(stats.input_tokens, stats.output_tokens, 0.0)
+        _merge_token_counts(self.by_region, other.by_region)
+        _merge_token_counts(self.by_identity, other.by_identity)
+        _merge_token_counts(self.by_model, other.by_model)
+        # by_usage_key is needed for pricing recalculation
+        _merge_token_counts(self.by_usage_key, other.by_usage_key)
 
         # Merge model_id_map (preserve first occurrence)
         for normalized, original in other.model_id_map.items():
@@ -106,27 +104,46 @@ class Metrics:
         for stats in self.by_model.values():
             stats.cost_usd = 0.0
 
+        # Many usage keys share a (model, region) pair, so resolve each rate and its warnings once
+        rates: Dict[Tuple[str, str], Optional[PriceRate]] = {}
+        model_id_map = self.model_id_map
+        by_region = self.by_region
+        by_identity = self.by_identity
+        by_model = self.by_model
+        total_cost = 0.0
         for (region, identity, model_id), stats in self.by_usage_key.items():
-            # Use original model ID (with profile) for pricing lookup
-            original_model_id = self.model_id_map.get(model_id, model_id)
-
-            # Get rate using the original model ID (preserves inference profile)
-            rate = pricing.get_rate(original_model_id, region)
-
-            if rate is None:
-                warnings.unpriced_models.add(model_id)
+            rate_key = (model_id, region)
+            if rate_key in rates:
+                rate = rates[rate_key]
             else:
-                if getattr(rate, "missing_input", False) or getattr(rate, "missing_output", False):
+                # Use original model ID (with profile) for pricing lookup
+                original_model_id = model_id_map.get(model_id, model_id)
+                rate = rates[rate_key] = pricing.get_rate(original_model_id, region)
+                if rate is None:
+                    warnings.unpriced_models.add(model_id)
+                elif getattr(rate, "missing_input", False) or getattr(rate, "missing_output", False):
                     warnings.partial_pricing_models.add(model_id)
             cost = compute_cost(rate, stats.input_tokens, stats.output_tokens)
             stats.cost_usd = cost
-            self.totals.cost_usd += cost
-            self.by_region[region].cost_usd += cost
-            self.by_identity[identity].cost_usd += cost
-            self.by_model[model_id].cost_usd += cost
+            total_cost += cost
+            by_region[region].cost_usd += cost
+            by_identity[identity].cost_usd += cost
+            by_model[model_id].cost_usd += cost
+        self.totals.cost_usd = total_cost
 
 
-@dataclass
+def _merge_token_counts(target: Dict, source: Dict) -> None:
+    """Add source token counts into target; costs are left for apply_pricing to recompute."""
+    for key, stats in source.items():
+        merged = target.get(key)
+        if merged is None:
+            merged = target[key] = TokenStats()
+        merged.input_tokens += stats.input_tokens
+        merged.output_tokens += stats.output_tokens
+        merged.total_tokens += stats.input_tokens + stats.output_tokens
+
+
+@dataclass(slots=True)
 class Warnings:
     unpriced_models: Set[str] = field(default_factory=set)
     partial_pricing_models: Set[str] = field(default_factory=set)
@@ -134,6 +151,15 @@ class Warnings:
     records_skipped: int = 0
     verification_errors: Set[str] = field(default_factory=set)
 
+    def merge(self, other: Warnings) -> Warnings:
+        """Merge another Warnings object into this one (additive)."""
+        self.unpriced_models |= other.unpriced_models
+        self.partial_pricing_models |= other.partial_pricing_models
+        self.missing_token_counts += other.missing_token_counts
+        self.records_skipped += other.records_skipped
+        self.verification_errors |= other.verification_errors
+        return self
+
     def to_dict(self) -> dict:
         return {
             "unpriced_models": sorted(self.unpriced_models),
@@ -2,16 +2,23 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 import re
 from typing import Dict, Iterable, Optional
 import unicodedata
 
 import requests
-import yaml
 from bs4 import BeautifulSoup
 
 from .adapters.pricing import canonical_model_key
+from .yaml_utils import dump_yaml
+
+try:
+    import lxml  # noqa: F401
+    _HTML_PARSER = "lxml"
+except ImportError:  # lxml is an optional speedup; fall back to the pure-Python parser
+    _HTML_PARSER = "html.parser"
 
 PRICING_URL = "https://aws.amazon.com/bedrock/pricing/"
 
@@ -48,7 +55,22 @@ _REGION_NAME_TO_CODE = {
 }
 
 
-@dataclass
+# Patterns used per table cell / inline line while scraping
+_PAREN_PATTERN = re.compile(r"\([^)]*\)")
+_PUBLIC_EXTENDED_ACCESS_PATTERN = re.compile(r"\bpublic extended access\b.*$", re.IGNORECASE)
+_EFFECTIVE_PATTERN = re.compile(r"\beffective\b.*$", re.IGNORECASE)
+_DASH_TAIL_PATTERN = re.compile(r"\s+-\s+.*$")
+_PRICE_NUMBER_PATTERN = re.compile(r"(\d+\.?\d*)")
+_HEADER_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+# Header words shared by every price column; they say nothing about the column's pricing group
+_HEADER_IGNORED_TOKENS = frozenset({"price", "per", "1", "000", "input", "output", "token", "tokens"})
+# Every region name in one alternation (longest first) so a line is scanned once, not once per region
+_REGION_NAME_PATTERN = re.compile(
+    "|".join(re.escape(name) for name in sorted(_REGION_NAME_TO_CODE, key=len, reverse=True))
+)
+
+
+@dataclass(slots=True)
 class ScrapeStats:
     rows_parsed: int = 0
     models_parsed: int = 0
@@ -63,7 +85,7 @@ def fetch_pricing_html(url: str = PRICING_URL, timeout: int = 20) -> str:
 
 
 def parse_pricing_html(html: str, *, region_override: Optional[str] = None) -> tuple[dict, ScrapeStats]:
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, _HTML_PARSER)
     rates: Dict[str, Dict[str, dict]] = {}
     stats = ScrapeStats()
 
@@ -77,9 +99,11 @@ def parse_pricing_html(html: str, *, region_override: Optional[str] = None) -> t
             continue
         region_idx = _find_header(headers, ["region"]) or _find_header(headers, ["location"])
         stats.tables_used += 1
+        # Tag.__eq__ compares whole subtrees, so skip header rows by identity instead of `in`
+        header_row_ids = {id(row) for row in header_rows}
 
         for row in table.find_all("tr"):
-            if row in header_rows:
+            if id(row) in header_row_ids:
                 continue
             cells = _expand_row_cells(row, len(headers))
             if len(cells) < len(headers):
@@ -87,18 +111,18 @@ def parse_pricing_html(html: str, *, region_override: Optional[str] = None) -> t
             model = _clean_model_name(cells[model_idx])
             if not model or model.lower() == "model":
                 continue
-            input_price = _parse_price(_clean_text(cells[input_idx]))
+            # _expand_row_cells already whitespace-normalized every cell
+            input_price = _parse_price(cells[input_idx])
             output_price = None
             if output_idx is not None:
-                output_price = _parse_price(_clean_text(cells[output_idx]))
+                output_price = _parse_price(cells[output_idx])
 
             if input_price is None and output_price is None:
                 continue
 
             region_code = region_override
             if region_code is None and region_idx is not None:
-                region_text = _clean_text(cells[region_idx])
-                region_code = _REGION_NAME_TO_CODE.get(_normalize_region_name(region_text))
+                region_code = _REGION_NAME_TO_CODE.get(_normalize_region_name(cells[region_idx]))
             if region_code is None:
                 region_code = "default"
 
@@ -133,7 +157,7 @@ def build_pricing_payload(rates: dict, source: str = PRICING_URL) -> dict:
 
 def write_pricing_yaml(path: Path, payload: dict) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(yaml.safe_dump(payload, sort_keys=True))
+    path.write_text(dump_yaml(payload, sort_keys=True))
 
 
 def _extract_headers(table) -> tuple[list[str], list]:
@@ -190,7 +214,7 @@ def _parse_price(text: str) -> Optional[float]:
     if not text:
         return None
     cleaned = text.replace(",", "")
-    match = re.search(r"(\d+\.?\d*)", cleaned)
+    match = _PRICE_NUMBER_PATTERN.search(cleaned)
     if not match:
         return None
     try:
@@ -209,15 +233,19 @@ def _clean_model_name(text: str) -> str:
     value = text
     if "|" in value:
         value = value.split("|")[-1]
-    value = re.sub(r"\([^)]*\)", "", value)
-    value = re.sub(r"\bpublic extended access\b.*$", "", value, flags=re.IGNORECASE)
-    value = re.sub(r"\beffective\b.*$", "", value, flags=re.IGNORECASE)
-    value = re.sub(r"\s+-\s+.*$", "", value)
+    value = _PAREN_PATTERN.sub("", value)
+    value = _PUBLIC_EXTENDED_ACCESS_PATTERN.sub("", value)
+    value = _EFFECTIVE_PATTERN.sub("", value)
+    value = _DASH_TAIL_PATTERN.sub("", value)
     return _clean_text(value)
 
 
+@lru_cache(maxsize=2048)
 def _normalize_region_name(value: str) -> str:
     lowered = value.lower()
+    # ASCII text has no combining marks to strip, so NFKD would return it unchanged
+    if lowered.isascii():
+        return lowered
     normalized = unicodedata.normalize("NFKD", lowered)
     return "".join(char for char in normalized if not unicodedata.combining(char))
 
@@ -344,9 +372,7 @@ def _header_group_overlap(input_header: str, output_header: str) -> int:
 
 
 def _header_group_tokens(header: str) -> set[str]:
-    tokens = re.findall(r"[a-z0-9]+", header.lower())
-    ignore = {"price", "per", "1", "000", "input", "output", "token", "tokens"}
-    return {token for token in tokens if token not in ignore}
+    return {token for token in _HEADER_TOKEN_PATTERN.findall(header.lower()) if token not in _HEADER_IGNORED_TOKENS}
 
 
 def _parse_inline_pricing(soup: BeautifulSoup, *, region_override: Optional[str]) -> tuple[dict, int]:
@@ -390,10 +416,13 @@ def _parse_inline_pricing(soup: BeautifulSoup, *, region_override: Optional[str]
     return rates, rows_parsed
 
 
+@lru_cache(maxsize=8)
+def _labeled_price_pattern(label: str) -> re.Pattern[str]:
+    return re.compile(rf"{re.escape(label)}[^$]*\$?([0-9.,]+)", re.IGNORECASE)
+
+
 def _parse_labeled_price(text: str, label: str) -> Optional[float]:
-    escaped_label = re.escape(label)
-    pattern = rf"{escaped_label}[^$]*\$?([0-9.,]+)"
-    match = re.search(pattern, text, re.IGNORECASE)
+    match = _labeled_price_pattern(label).search(text)
     if not match:
         return None
     return _parse_price(match.group(1))
@@ -402,16 +431,10 @@ def _parse_labeled_price(text: str, label: str) -> Optional[float]:
 def _split_model_and_regions(text: str) -> tuple[str, list[str]]:
     if not text:
         return "", []
-    normalized = _normalize_region_name(text)
-    first_idx: Optional[int] = None
-    for region_name in _REGION_NAME_TO_CODE:
-        idx = normalized.find(region_name)
-        if idx == -1:
-            continue
-        if first_idx is None or idx < first_idx:
-            first_idx = idx
-    if first_idx is None:
+    match = _REGION_NAME_PATTERN.search(_normalize_region_name(text))
+    if match is None:
         return text.strip(), []
+    first_idx = match.start()
     model_text = text[:first_idx].strip(" ,;|-")
     region_text = text[first_idx:]
     region_codes = _extract_region_codes(region_text)
@@ -419,19 +442,10 @@ def _split_model_and_regions(text: str) -> tuple[str, list[str]]:
 
 
 def _extract_region_codes(text: str) -> list[str]:
+    # Matches arrive in text order; dict keys dedupe while keeping first-seen order
     normalized = _normalize_region_name(text)
-    matches: list[tuple[int, str]] = []
-    for region_name, region_code in _REGION_NAME_TO_CODE.items():
-        idx = normalized.find(region_name)
-        if idx == -1:
-            continue
-        matches.append((idx, region_code))
-    matches.sort(key=lambda item: item[0])
-    region_codes: list[str] = []
-    for _, code in matches:
-        if code not in region_codes:
-            region_codes.append(code)
-    return region_codes
+    codes = (_REGION_NAME_TO_CODE[match.group()] for match in _REGION_NAME_PATTERN.finditer(normalized))
+    return list(dict.fromkeys(codes))
 
 
 def _build_rate_entry(input_price: Optional[float], output_price: Optional[float]) -> dict:
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import heapq
 from datetime import datetime, timezone
-from typing import Dict, List
+from typing import Dict, Iterable, List, Tuple
 
 from .models import Metrics, TokenStats, Warnings
 
@@ -30,62 +31,65 @@ CSV_FIELDS = [
 
 def format_report(report_date: str, metrics: Metrics, warnings: Warnings) -> str:
     totals = metrics.totals
-    lines: List[str] = [f"Bedrock usage report for {report_date} (UTC)"]
+    header = f"Bedrock usage report for {report_date} (UTC)"
     if totals.total_tokens == 0:
-        lines.append("No Bedrock usage recorded for this date.")
-        return "\n".join(lines)
+        return f"{header}\nNo Bedrock usage recorded for this date."
+
+    # Each section is joined in one pass and the sections are joined once at the end
+    sections: List[str] = [
+        header,
+        f"Total tokens: {totals.total_tokens:,} (input {totals.input_tokens:,} / output {totals.output_tokens:,})",
+        f"Total cost: ${totals.cost_usd:,.4f}",
+    ]
+    if metrics.by_region:
+        sections.append(_stats_section("By region:", sorted(metrics.by_region.items())))
+    if metrics.by_model:
+        sections.append(_stats_section("By model:", _by_model(metrics)))
+    if metrics.by_identity:
+        sections.append(_stats_section("Top identities:", _top_identities(metrics)))
 
-    lines.append(
-        f"Total tokens: {totals.total_tokens:,} (input {totals.input_tokens:,} / output {totals.output_tokens:,})"
-    )
-    lines.append(f"Total cost: ${totals.cost_usd:,.4f}")
+    warning_text = _format_warnings(warnings)
+    if warning_text:
+        sections.append("Warnings:")
+        sections.append(warning_text)
 
-    if metrics.by_region:
-        lines.append("By region:")
-        for region, stats in sorted(metrics.by_region.items()):
-            lines.append(
-                f"- {region}: {stats.total_tokens:,} tokens (${stats.cost_usd:,.4f})"
-            )
+    return "\n".join(sections)
 
-    if metrics.by_model:
-        lines.append("By model:")
-        for model_id, stats in _by_model(metrics):
-            lines.append(
-                f"- {model_id}: {stats.total_tokens:,} tokens (${stats.cost_usd:,.4f})"
-            )
 
-    if metrics.by_identity:
-        lines.append("Top identities:")
-        for identity, stats in _top_identities(metrics):
-            lines.append(
-                f"- {identity}: {stats.total_tokens:,} tokens (${stats.cost_usd:,.4f})"
-            )
+def _stats_section(title: str, items: Iterable[tuple[str, TokenStats]]) -> str:
+    # A list comprehension beats a generator here: join would materialize the generator anyway
+    body = "\n".join([f"- {key}: {stats.total_tokens:,} tokens (${stats.cost_usd:,.4f})" for key, stats in items])
+    return f"{title}\n{body}"
 
-    warning_lines = _format_warnings(warnings)
-    if warning_lines:
-        lines.append("Warnings:")
-        lines.extend(warning_lines)
 
-    return "\n".join(lines)
+def iso_times(report_start: datetime, report_end: datetime, generated_at: datetime) -> Tuple[str, str, str]:
+    """Return the UTC ISO strings for (report_start, report_end, generated_at).
+
+    Computed once per run and shared by the snapshot and the CSV row.
+    """
+    return (
+        report_start.astimezone(timezone.utc).isoformat(),
+        report_end.astimezone(timezone.utc).isoformat(),
+        generated_at.astimezone(timezone.utc).isoformat(),
+    )
 
 
 def build_report_snapshot(
     *,
     report_date: str,
-    report_start: datetime,
-    report_end: datetime,
-    generated_at: datetime,
+    iso_times: Tuple[str, str, str],
     metrics: Metrics,
     warnings: Warnings,
     stats: Dict[str, object],
     report_text: str,
 ) -> Dict[str, object]:
+    report_start, report_end, generated_at = iso_times
     return {
         "schema_version": 1,
         "report_date": report_date,
-        "report_start": report_start.astimezone(timezone.utc).isoformat(),
-        "report_end": report_end.astimezone(timezone.utc).isoformat(),
-        "generated_at": generated_at.astimezone(timezone.utc).isoformat(),
+        "report_start": report_start,
+        "report_end": report_end,
+        "generated_at": generated_at,
         "report": {"text": report_text},
         "metrics": _metrics_to_dict(metrics),
         "warnings": warnings.to_dict(),
@@ -96,40 +100,40 @@ def build_report_snapshot(
 def build_csv_row(
     *,
     report_date: str,
-    report_start: datetime,
-    report_end: datetime,
-    generated_at: datetime,
+    iso_times: Tuple[str, str, str],
     metrics: Metrics,
     warnings: Warnings,
     stats: Dict[str, object],
-) -> Dict[str, object]:
+) -> Tuple[object, ...]:
+    """Return one CSV row with values in CSV_FIELDS order."""
     totals = metrics.totals
-    return {
-        "report_date": report_date,
-        "report_start": report_start.astimezone(timezone.utc).isoformat(),
-        "report_end": report_end.astimezone(timezone.utc).isoformat(),
-        "generated_at": generated_at.astimezone(timezone.utc).isoformat(),
-        "total_tokens": totals.total_tokens,
-        "input_tokens": totals.input_tokens,
-        "output_tokens": totals.output_tokens,
-        "total_cost_usd": totals.cost_usd,
-        "regions": len(metrics.by_region),
-        "models": len(metrics.by_model),
-        "identities": len(metrics.by_identity),
-        "objects_listed": stats.get("objects_listed", 0),
-        "objects_processed": stats.get("objects_processed", 0),
-        "records_parsed": stats.get("records_parsed", 0),
-        "records_used": stats.get("records_used", 0),
-        "missing_token_counts": warnings.missing_token_counts,
-        "records_skipped": warnings.records_skipped,
-        "unpriced_models": "|".join(sorted(warnings.unpriced_models)),
-        "verification_errors": "|".join(sorted(warnings.verification_errors)),
-    }
+    report_start, report_end, generated_at = iso_times
+    return (
+        report_date,
+        report_start,
+        report_end,
+        generated_at,
+        totals.total_tokens,
+        totals.input_tokens,
+        totals.output_tokens,
+        totals.cost_usd,
+        len(metrics.by_region),
+        len(metrics.by_model),
+        len(metrics.by_identity),
+        stats.get("objects_listed", 0),
+        stats.get("objects_processed", 0),
+        stats.get("records_parsed", 0),
+        stats.get("records_used", 0),
+        warnings.missing_token_counts,
+        warnings.records_skipped,
+        "|".join(sorted(warnings.unpriced_models)),
+        "|".join(sorted(warnings.verification_errors)),
+    )
 
 
 def _top_identities(metrics: Metrics) -> List[tuple[str, object]]:
-    ranked = sorted(metrics.by_identity.items(), key=lambda item: item[1].total_tokens, reverse=True)
-    return ranked[:5]
+    # Same order as sorted(..., reverse=True)[:5], ties included, without sorting every identity
+    return heapq.nlargest(5, metrics.by_identity.items(), key=lambda item: item[1].total_tokens)
 
 
 def _by_model(metrics: Metrics) -> List[tuple[str, object]]:
@@ -137,28 +141,31 @@ def _by_model(metrics: Metrics) -> List[tuple[str, object]]:
     return ranked
 
 
-def _format_warnings(warnings: Warnings) -> List[str]:
-    lines: List[str] = []
+def _format_warnings(warnings: Warnings) -> str:
+    """Return the warning blocks joined into one string, or "" when there are none."""
+    blocks: List[str] = []
     if warnings.unpriced_models:
-        lines.append("")
-        lines.append("UNPRICED MODELS DETECTED")
-        lines.append("The following models had $0.00 cost due to missing pricing:")
-        for model_id in sorted(warnings.unpriced_models):
-            display_id = model_id.split("/")[-1] if "/" in model_id else model_id
-            lines.append(f"  - {display_id}")
-        lines.append("")
-        lines.append("Action required: Update config/pricing.yaml with these model versions")
+        model_lines = "\n".join(
+            [f"  - {model_id.rpartition('/')[2]}" for model_id in sorted(warnings.unpriced_models)]
+        )
+        blocks.append(
+            "\nUNPRICED MODELS DETECTED\n"
+            "The following models had $0.00 cost due to missing pricing:\n"
+            f"{model_lines}\n"
+            "\n"
+            "Action required: Update config/pricing.yaml with these model versions"
+        )
     if warnings.partial_pricing_models:
         models = ", ".join(sorted(warnings.partial_pricing_models))
-        lines.append(f"- Partial pricing (missing input/output rates) for models: {models}")
+        blocks.append(f"- Partial pricing (missing input/output rates) for models: {models}")
     if warnings.missing_token_counts:
-        lines.append(f"- {warnings.missing_token_counts} records missing token counts")
+        blocks.append(f"- {warnings.missing_token_counts} records missing token counts")
     if warnings.records_skipped:
-        lines.append(f"- {warnings.records_skipped} records skipped due to missing fields")
+        blocks.append(f"- {warnings.records_skipped} records skipped due to missing fields")
     if warnings.verification_errors:
         issues = ", ".join(sorted(warnings.verification_errors))
-        lines.append(f"- Verification issues: {issues}")
-    return lines
+        blocks.append(f"- Verification issues: {issues}")
+    return "\n".join(blocks)
 
 
 def _metrics_to_dict(metrics: Metrics) -> Dict[str, object]:
@@ -181,18 +188,21 @@ def _token_stats_to_dict(stats: TokenStats) -> Dict[str, object]:
 
 
 def _stats_map_to_dict(stats_map: Dict[str, TokenStats]) -> Dict[str, object]:
-    return {key: _token_stats_to_dict(stats_map[key]) for key in sorted(stats_map)}
+    # Keys are unique, so sorting the items never compares two TokenStats
+    return {key: _token_stats_to_dict(stats) for key, stats in sorted(stats_map.items())}
 
 
 def _usage_key_map_to_list(stats_map: Dict[tuple[str, str, str], TokenStats]) -> List[Dict[str, object]]:
-    entries: List[Dict[str, object]] = []
-    for (region, identity, model_id), stats in sorted(stats_map.items()):
-        entries.append(
-            {
-                "region": region,
-                "identity": identity,
-                "model_id": model_id,
-                **_token_stats_to_dict(stats),
-            }
-        )
-    return entries
+    # Fields are written inline rather than unpacking a temporary _token_stats_to_dict per entry
+    return [
+        {
+            "region": region,
+            "identity": identity,
+            "model_id": model_id,
+            "input_tokens": stats.input_tokens,
+            "output_tokens": stats.output_tokens,
+            "total_tokens": stats.total_tokens,
+            "cost_usd": stats.cost_usd,
+        }
+        for (region, identity, model_id), stats in sorted(stats_map.items())
+    ]
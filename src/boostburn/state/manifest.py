@@ -2,10 +2,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
-import json
-from typing import Dict, Optional, Tuple
+from typing import Any, Dict, Optional, Tuple
 
 from ..adapters.aws_s3 import S3Adapter
+from ..json_utils import dump_json, load_json
 
 
 MANIFEST_VERSION = 1
@@ -15,7 +15,7 @@ MANIFEST_VERSION = 1
 class ManifestState:
     version: int = MANIFEST_VERSION
     last_datehour: Optional[str] = None
-    processed: Dict[str, Dict[str, str]] = field(default_factory=dict)
+    processed: Dict[str, Dict[str, Any]] = field(default_factory=dict)  # key -> {"etag", "seen_at" (epoch seconds)}
     updated_at: Optional[str] = None
     lookback_hours: int = 6
 
@@ -35,40 +35,43 @@ def load_manifest(
     key: str,
     lookback_hours: int,
 ) -> Tuple[ManifestState, Optional[str]]:
-    etag = s3.get_object_etag(bucket, key)
-    if etag is None:
+    payload, etag = s3.get_object(bucket, key)
+    if payload is None:
         return ManifestState(lookback_hours=lookback_hours), None
-    payload = s3.get_object_bytes(bucket, key)
-    data = json.loads(payload.decode("utf-8"))
+    data = load_json(payload)
     manifest = ManifestState(
         version=data.get("version", MANIFEST_VERSION),
         last_datehour=data.get("last_datehour"),
-        processed=data.get("processed", {}),
+        processed=_migrate_seen_at(data.get("processed", {})),
         updated_at=data.get("updated_at"),
         lookback_hours=int(data.get("lookback_hours", lookback_hours)),
     )
     return manifest, etag
 
 
-def prune_manifest(manifest: ManifestState, now: datetime) -> ManifestState:
-    cutoff = now - timedelta(hours=manifest.lookback_hours)
-    pruned = {}
-    for key, meta in manifest.processed.items():
+def _migrate_seen_at(processed: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Convert ISO seen_at strings from older manifests to epoch seconds."""
+    for meta in processed.values():
         seen_at = meta.get("seen_at")
-        if not seen_at:
+        if not isinstance(seen_at, str):
             continue
         try:
-            seen_dt = datetime.fromisoformat(seen_at.replace("Z", "+00:00"))
+            meta["seen_at"] = int(datetime.fromisoformat(seen_at.replace("Z", "+00:00")).timestamp())
         except ValueError:
-            continue
-        if seen_dt >= cutoff:
-            pruned[key] = meta
-    manifest.processed = pruned
+            meta["seen_at"] = 0  # Unparseable, let the next prune drop it
+    return processed
+
+
+def prune_manifest(manifest: ManifestState, now: datetime) -> ManifestState:
+    cutoff_ts = (now - timedelta(hours=manifest.lookback_hours)).timestamp()
+    manifest.processed = {
+        key: meta for key, meta in manifest.processed.items() if (meta.get("seen_at") or 0) >= cutoff_ts
+    }
     return manifest
 
 
 def record_processed(manifest: ManifestState, key: str, etag: str, seen_at: datetime) -> None:
-    manifest.processed[key] = {"etag": etag, "seen_at": seen_at.astimezone(timezone.utc).isoformat()}
+    manifest.processed[key] = {"etag": etag, "seen_at": int(seen_at.timestamp())}
 
 
 def update_last_datehour(manifest: ManifestState, datehour: Optional[str]) -> None:
@@ -76,7 +79,7 @@ def update_last_datehour(manifest: ManifestState, datehour: Optional[str]) -> No
         manifest.last_datehour = datehour
 
 
-def save_manifest(s3: S3Adapter, bucket: str, key: str, manifest: ManifestState) -> str:
-    manifest.updated_at = datetime.now(timezone.utc).isoformat()
-    payload = json.dumps(manifest.to_dict(), sort_keys=True).encode("utf-8")
+def save_manifest(s3: S3Adapter, bucket: str, key: str, manifest: ManifestState, now: datetime) -> str:
+    manifest.updated_at = now.astimezone(timezone.utc).isoformat()
+    payload = dump_json(manifest.to_dict(), sort_keys=True)
     return s3.put_object(bucket, key, payload, content_type="application/json")
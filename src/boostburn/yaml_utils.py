@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from typing import IO, Any
+
+import yaml
+
+try:
+    from yaml import CSafeDumper as _SafeDumper
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _SafeDumper
+    from yaml import SafeLoader as _SafeLoader
+
+
+def load_yaml(source: str | bytes | IO[bytes]) -> Any:
+    """Parse YAML with the libyaml-backed safe loader when available.
+
+    Accepts a binary file handle so libyaml can read and decode the bytes itself.
+    """
+    return yaml.load(source, Loader=_SafeLoader)
+
+
+def dump_yaml(data: Any, *, sort_keys: bool = True) -> str:
+    """Serialize YAML with the libyaml-backed safe dumper when available."""
+    return yaml.dump(data, Dumper=_SafeDumper, sort_keys=sort_keys)
@@ -0,0 +1,68 @@
+from datetime import datetime, timezone
+
+from boostburn.ingest.aggregate import aggregate_records
+from boostburn.models import Metrics
+
+
+def _record(timestamp, input_tokens=10, output_tokens=5, **extra):
+    record = {
+        "timestamp": timestamp,
+        "modelId": "anthropic.claude-3-haiku-20240307-v1:0",
+        "identity": {"arn": "arn:aws:iam::123:user/alice"},
+        "input": {"inputTokenCount": input_tokens},
+        "output": {"outputTokenCount": output_tokens},
+    }
+    record.update(extra)
+    return record
+
+
+def test_aggregate_records_filters_window_and_counts():
+    metrics = Metrics()
+    skipped = []
+    records = [
+        _record("2026-02-01T01:00:00Z"),
+        _record("2026-02-01T02:00:00Z", input_tokens=0, output_tokens=0, region="us-west-2"),
+        _record("2026-02-02T00:00:00Z"),
+        {"modelId": "anthropic.claude-3-haiku-20240307-v1:0"},
+    ]
+
+    counts = aggregate_records(
+        records,
+        region="us-east-1",
+        report_start=datetime(2026, 2, 1, tzinfo=timezone.utc),
+        report_end=datetime(2026, 2, 2, tzinfo=timezone.utc),
+        metrics=metrics,
+        skipped=skipped,
+    )
+
+    assert (counts.records_used, counts.records_skipped, counts.missing_token_counts) == (2, 1, 1)
+    assert skipped == [records[3]]
+    assert metrics.totals.total_tokens == 15
+    assert set(metrics.by_region) == {"us-east-1", "us-west-2"}
+    assert set(metrics.by_model) == {"anthropic.claude-3-haiku-20240307-v1"}
+
+
+def test_aggregate_records_sums_per_key_and_keeps_first_model_id():
+    metrics = Metrics()
+    profile = "arn:aws:bedrock:us-east-1:123:inference-profile/us.anthropic.claude-3-haiku-20240307-v1:0"
+    records = [
+        _record("2026-02-01T01:00:00Z", modelId="us.anthropic.claude-3-haiku-20240307-v1:0"),
+        _record("2026-02-01T02:00:00Z", input_tokens=1, output_tokens=2, modelId=profile),
+        _record("2026-02-01T03:00:00Z", identity={"arn": "arn:aws:iam::123:user/bob"}, modelId=profile),
+    ]
+
+    counts = aggregate_records(
+        records,
+        region="us-east-1",
+        report_start=datetime(2026, 2, 1, tzinfo=timezone.utc),
+        report_end=datetime(2026, 2, 2, tzinfo=timezone.utc),
+        metrics=metrics,
+    )
+
+    model_id = "us.anthropic.claude-3-haiku-20240307-v1"
+    assert counts.records_used == 3
+    assert metrics.by_usage_key[("us-east-1", "arn:aws:iam::123:user/alice", model_id)].total_tokens == 18
+    assert metrics.by_usage_key[("us-east-1", "arn:aws:iam::123:user/bob", model_id)].total_tokens == 15
+    assert metrics.by_model[model_id].total_tokens == 33
+    assert metrics.totals.total_tokens == 33
+    assert metrics.model_id_map == {model_id: "us.anthropic.claude-3-haiku-20240307-v1:0"}
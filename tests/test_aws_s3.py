@@ -0,0 +1,36 @@
+import io
+from unittest.mock import MagicMock
+
+import pytest
+from botocore.exceptions import ClientError
+
+from boostburn.adapters.aws_s3 import AwsS3Adapter
+
+
+def _adapter(client: MagicMock) -> AwsS3Adapter:
+    session = MagicMock()
+    session.client.return_value = client
+    return AwsS3Adapter(session=session)
+
+
+def test_get_object_returns_body_and_etag_in_one_call():
+    client = MagicMock()
+    client.get_object.return_value = {"Body": io.BytesIO(b"{}"), "ETag": '"abc123"'}
+    adapter = _adapter(client)
+
+    assert adapter.get_object("bucket", "manifest.json") == (b"{}", "abc123")
+    client.get_object.assert_called_once_with(Bucket="bucket", Key="manifest.json")
+    client.head_object.assert_not_called()
+
+
+def test_get_object_missing_key():
+    client = MagicMock()
+    client.get_object.side_effect = ClientError({"Error": {"Code": "NoSuchKey"}}, "GetObject")
+    assert _adapter(client).get_object("bucket", "manifest.json") == (None, None)
+
+
+def test_get_object_reraises_other_errors():
+    client = MagicMock()
+    client.get_object.side_effect = ClientError({"Error": {"Code": "AccessDenied"}}, "GetObject")
+    with pytest.raises(ClientError):
+        _adapter(client).get_object("bucket", "manifest.json")
@@ -16,12 +16,16 @@ def test_load_dotenv(monkeypatch, tmp_path):
                 "EMPTY=",
                 "COMMENTED=value # inline comment",
                 "BADLINE",
+                "  SPACED = 'single # kept'  ",
+                "CRLF=windows\r",
             ]
         ),
         encoding="utf-8",
     )
 
     monkeypatch.setenv("BOOSTBURN_REPORT_DATE", "preset")
+    for key in ("SLACK_WEBHOOK_URL", "QUOTED", "EMPTY", "COMMENTED", "BADLINE", "SPACED", "CRLF"):
+        monkeypatch.delenv(key, raising=False)
     load_dotenv(Path(env_path))
 
     assert os.getenv("BOOSTBURN_REPORT_DATE") == "preset"
@@ -29,3 +33,6 @@ def test_load_dotenv(monkeypatch, tmp_path):
     assert os.getenv("QUOTED") == "hello world"
     assert os.getenv("EMPTY") == ""
     assert os.getenv("COMMENTED") == "value"
+    assert os.getenv("SPACED") == "single # kept"
+    assert os.getenv("CRLF") == "windows"
+    assert os.getenv("BADLINE") is None
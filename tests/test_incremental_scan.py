@@ -46,7 +46,7 @@ class TestScanEndDatehourCapping:
         with tempfile.TemporaryDirectory() as tmpdir:
             # Create minimal dependencies
             mock_s3 = MagicMock()
-            mock_s3.get_object_etag.return_value = None  # No existing manifest
+            mock_s3.get_object.return_value = (None, None)  # No existing manifest
             mock_s3.list_objects.return_value = []  # No objects found
 
             deps = Dependencies(
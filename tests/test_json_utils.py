@@ -0,0 +1,29 @@
+import json
+
+import pytest
+
+from boostburn import json_utils
+from boostburn.json_utils import load_json
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def decoder(request, monkeypatch):
+    if request.param == "stdlib":
+        monkeypatch.setattr(json_utils, "orjson", None)
+    elif json_utils.orjson is None:
+        pytest.skip("orjson is not installed")
+    return request.param
+
+
+def test_load_json_accepts_lone_surrogate_escape(decoder):
+    assert load_json(b'{"text": "\\ud83d cut"}') == {"text": "\ud83d cut"}
+
+
+def test_load_json_replaces_invalid_utf8(decoder):
+    assert load_json(b'{"text": "bad \xff byte"}') == {"text": "bad � byte"}
+
+
+def test_load_json_still_rejects_invalid_json(decoder):
+    with pytest.raises(json.JSONDecodeError):
+        load_json(b'{"a": 1}\n{"a": 2}')
+
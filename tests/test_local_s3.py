@@ -0,0 +1,56 @@
+from boostburn.adapters.local_s3 import LocalS3Adapter
+
+
+def _write(path, body=b"{}"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(body)
+
+
+def test_list_objects_filters_by_prefix(tmp_path):
+    root = tmp_path / "bucket"
+    _write(root / "AWSLogs" / "2026" / "02" / "01" / "17" / "a.json")
+    _write(root / "AWSLogs" / "2026" / "02" / "01" / "18" / "b.json")
+    _write(root / "AWSLogs" / "2026" / "02" / "011" / "c.json")
+    _write(root / "manifests" / "bedrock-usage" / "manifest.json")
+
+    adapter = LocalS3Adapter({"bucket": root})
+
+    keys = sorted(obj.key for obj in adapter.list_objects("bucket", "AWSLogs/2026/02/01/17/"))
+    assert keys == ["AWSLogs/2026/02/01/17/a.json"]
+
+    keys = sorted(obj.key for obj in adapter.list_objects("bucket", "AWSLogs/2026/02/01"))
+    assert keys == [
+        "AWSLogs/2026/02/01/17/a.json",
+        "AWSLogs/2026/02/01/18/b.json",
+        "AWSLogs/2026/02/011/c.json",
+    ]
+
+    assert len(adapter.list_objects("bucket", "")) == 4
+    assert adapter.list_objects("bucket", "AWSLogs/2026/03/") == []
+
+
+def test_list_objects_etag_matches_get_object_etag(tmp_path):
+    root = tmp_path / "bucket"
+    adapter = LocalS3Adapter({"bucket": root})
+
+    etag = adapter.put_object("bucket", "manifests/manifest.json", b'{"version": 1}')
+
+    [obj] = adapter.list_objects("bucket", "manifests/")
+    assert obj.etag == etag
+    assert adapter.get_object_etag("bucket", "manifests/manifest.json") == etag
+    assert adapter.get_object_etag("bucket", "manifests/missing.json") is None
+    assert adapter.get_object("bucket", "manifests/manifest.json") == (b'{"version": 1}', etag)
+    assert adapter.get_object("bucket", "manifests/missing.json") == (None, None)
+
+
+def test_list_objects_descends_into_symlinked_directories(tmp_path):
+    root = tmp_path / "bucket"
+    _write(tmp_path / "elsewhere" / "17" / "a.json")
+    _write(root / "AWSLogs" / "2026" / "02" / "01" / "18" / "b.json")
+    (root / "AWSLogs" / "2026" / "02" / "01" / "17").symlink_to(tmp_path / "elsewhere" / "17", target_is_directory=True)
+
+    adapter = LocalS3Adapter({"bucket": root})
+
+    keys = sorted(obj.key for obj in adapter.list_objects("bucket", "AWSLogs/2026/02/01/"))
+    assert keys == ["AWSLogs/2026/02/01/17/a.json", "AWSLogs/2026/02/01/18/b.json"]
+    assert [obj.key for obj in adapter.list_objects("bucket", "AWSLogs/2026/02/01/17/")] == ["AWSLogs/2026/02/01/17/a.json"]
@@ -0,0 +1,28 @@
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+
+from boostburn.logging_utils import log_event
+
+
+class _RecordingLogger:
+    def __init__(self):
+        self.messages = []
+
+    def info(self, message):
+        self.messages.append(message)
+
+
+def test_log_event_emits_sorted_json():
+    logger = _RecordingLogger()
+    log_event(logger, "plan_scan", region="us-east-1", prefixes=3, path=Path("state"))
+
+    message = logger.messages[0]
+    assert json.loads(message) == {"event": "plan_scan", "path": "state", "prefixes": 3, "region": "us-east-1"}
+    assert list(json.loads(message)) == ["event", "path", "prefixes", "region"]
+
+
+def test_log_event_serializes_datetimes():
+    logger = _RecordingLogger()
+    log_event(logger, "load_config", start=datetime(2026, 2, 1, tzinfo=timezone.utc))
+    assert json.loads(logger.messages[0])["start"].startswith("2026-02-01")
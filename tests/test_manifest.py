@@ -0,0 +1,79 @@
+from datetime import datetime, timedelta, timezone
+
+from boostburn.adapters.local_s3 import LocalS3Adapter
+from boostburn.state.manifest import (
+    ManifestState,
+    load_manifest,
+    prune_manifest,
+    record_processed,
+    save_manifest,
+)
+
+
+def test_save_and_load_manifest_round_trip(tmp_path):
+    s3 = LocalS3Adapter({"bucket": tmp_path})
+    manifest = ManifestState(last_datehour="2026-02-01T17", lookback_hours=4)
+    record_processed(manifest, "AWSLogs/a.json", "etag-a", datetime(2026, 2, 1, 17, 5, tzinfo=timezone.utc))
+
+    now = datetime(2026, 2, 1, 19, 30, tzinfo=timezone(timedelta(hours=2)))
+    etag = save_manifest(s3, "bucket", "manifests/manifest.json", manifest, now)
+    assert manifest.updated_at == "2026-02-01T17:30:00+00:00"
+    payload = (tmp_path / "manifests" / "manifest.json").read_bytes()
+    assert payload.startswith(b'{"last_datehour":')  # keys are sorted
+
+    loaded, loaded_etag = load_manifest(s3, "bucket", "manifests/manifest.json", lookback_hours=6)
+    assert loaded_etag == etag
+    assert loaded.to_dict() == manifest.to_dict()
+
+
+def test_load_manifest_missing(tmp_path):
+    s3 = LocalS3Adapter({"bucket": tmp_path})
+    manifest, etag = load_manifest(s3, "bucket", "manifests/manifest.json", lookback_hours=3)
+    assert etag is None
+    assert manifest.lookback_hours == 3
+    assert manifest.processed == {}
+
+
+def test_record_processed_stores_epoch_seconds():
+    manifest = ManifestState()
+    seen_at = datetime(2026, 2, 1, 17, 5, 30, 900000, tzinfo=timezone.utc)
+    record_processed(manifest, "a.json", "etag-a", seen_at)
+    assert manifest.processed["a.json"] == {"etag": "etag-a", "seen_at": int(seen_at.timestamp())}
+
+
+def test_prune_manifest_drops_entries_outside_lookback():
+    now = datetime(2026, 2, 1, 12, tzinfo=timezone.utc)
+    manifest = ManifestState(lookback_hours=2)
+    record_processed(manifest, "fresh.json", "e1", now - timedelta(hours=1))
+    record_processed(manifest, "edge.json", "e2", now - timedelta(hours=2))
+    record_processed(manifest, "stale.json", "e3", now - timedelta(hours=3))
+    manifest.processed["unknown.json"] = {"etag": "e4"}
+
+    prune_manifest(manifest, now)
+    assert sorted(manifest.processed) == ["edge.json", "fresh.json"]
+
+
+def test_load_manifest_migrates_iso_seen_at(tmp_path):
+    s3 = LocalS3Adapter({"bucket": tmp_path})
+    path = tmp_path / "manifest.json"
+    path.write_text(
+        '{"version": 1, "processed": {'
+        '"a.json": {"etag": "e1", "seen_at": "2026-02-01T11:00:00+00:00"}, '
+        '"b.json": {"etag": "e2", "seen_at": "2026-02-01T11:30:00Z"}, '
+        '"c.json": {"etag": "e3", "seen_at": "garbage"}}}',
+        encoding="utf-8",
+    )
+
+    manifest, _ = load_manifest(s3, "bucket", "manifest.json", lookback_hours=6)
+    assert manifest.processed["a.json"]["seen_at"] == int(datetime(2026, 2, 1, 11, tzinfo=timezone.utc).timestamp())
+    assert manifest.processed["b.json"]["seen_at"] == int(datetime(2026, 2, 1, 11, 30, tzinfo=timezone.utc).timestamp())
+    assert manifest.processed["c.json"]["seen_at"] == 0
+
+    prune_manifest(manifest, datetime(2026, 2, 1, 12, tzinfo=timezone.utc))
+    assert sorted(manifest.processed) == ["a.json", "b.json"]
+
+
+def test_to_dict_references_processed_without_copying():
+    manifest = ManifestState()
+    record_processed(manifest, "a.json", "etag-a", datetime(2026, 2, 1, tzinfo=timezone.utc))
+    assert manifest.to_dict()["processed"] is manifest.processed
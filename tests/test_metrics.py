@@ -216,3 +216,95 @@ def test_apply_pricing_populates_by_usage_key_costs():
 
     # Also verify totals match (sanity check)
     assert abs(metrics.totals.cost_usd - expected_cost) < 1e-9
+
+
+def test_warnings_merge():
+    """Merging warnings should union model sets and add counters."""
+    from boostburn.models import Warnings
+
+    w1 = Warnings(missing_token_counts=1, records_skipped=2)
+    w1.unpriced_models.add("model-a")
+    w2 = Warnings(missing_token_counts=3)
+    w2.unpriced_models.add("model-b")
+    w2.verification_errors.add("by_region_mismatch")
+
+    w1.merge(w2)
+
+    assert w1.unpriced_models == {"model-a", "model-b"}
+    assert w1.verification_errors == {"by_region_mismatch"}
+    assert w1.missing_token_counts == 4
+    assert w1.records_skipped == 2
+
+
+def test_apply_pricing_looks_up_each_model_region_once():
+    """Usage keys sharing a (model, region) pair should reuse one rate lookup."""
+    from boostburn.models import Warnings
+
+    metrics = Metrics()
+    for identity in ("arn:a", "arn:b", "arn:c"):
+        for region in ("us-east-1", "us-east-2"):
+            metrics.add_usage(
+                region=region,
+                identity=identity,
+                model_id="model",
+                input_tokens=1000,
+                output_tokens=1000,
+                cost_usd=0.0,
+            )
+
+    calls = []
+
+    class CountingPricingProvider:
+        def get_rate(self, model_id, region):
+            calls.append((model_id, region))
+            return PriceRate(input_per_1k=0.001, output_per_1k=0.002)
+
+    metrics.apply_pricing(CountingPricingProvider(), Warnings())
+
+    assert sorted(calls) == [("model", "us-east-1"), ("model", "us-east-2")]
+    assert abs(metrics.totals.cost_usd - 6 * 0.003) < 1e-9
+    assert abs(metrics.by_identity["arn:a"].cost_usd - 2 * 0.003) < 1e-9
+
+
+def test_apply_pricing_matches_compute_cost_exactly():
+    from boostburn.models import Warnings
+
+    rate = PriceRate(input_per_1k=0.0008, output_per_1k=0.004)
+    metrics = Metrics()
+    metrics.add_usage(
+        region="us-east-2",
+        identity="arn:test",
+        model_id="model",
+        input_tokens=123457,
+        output_tokens=98765,
+        cost_usd=0.0,
+    )
+
+    class FixedPricingProvider:
+        def get_rate(self, model_id, region):
+            return rate
+
+    metrics.apply_pricing(FixedPricingProvider(), Warnings())
+
+    assert metrics.totals.cost_usd == compute_cost(rate, 123457, 98765)
+
+
+def test_metrics_merge_updates_existing_stats_in_place():
+    """merge mutates existing TokenStats and never aliases the other object's stats."""
+    m1 = Metrics()
+    m2 = Metrics()
+    for index in range(1000):
+        usage = {"region": "us-east-1", "model_id": "m", "cost_usd": 0.0}
+        m1.add_usage(identity=f"id-{index}", input_tokens=1, output_tokens=1, **usage)
+        m2.add_usage(identity=f"id-{index + 500}", input_tokens=2, output_tokens=0, **usage)
+    existing = {key: id(stats) for key, stats in m1.by_identity.items()}
+
+    m1.merge(m2)
+
+    assert len(m1.by_identity) == 1500
+    assert all(id(m1.by_identity[key]) == stats_id for key, stats_id in existing.items())
+    assert all(m1.by_identity[key] is not stats for key, stats in m2.by_identity.items())
+    assert m1.by_identity["id-0"].total_tokens == 2
+    assert m1.by_identity["id-500"].total_tokens == 4
+    assert m1.by_identity["id-1499"].total_tokens == 2
+    assert m1.totals.total_tokens == 4000
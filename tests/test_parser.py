@@ -1,3 +1,6 @@
+import gzip
+import io
+from datetime import datetime, timezone
 from pathlib import Path
 
 import pytest
@@ -5,7 +8,10 @@ import pytest
 from boostburn.ingest.bedrock_parser import (
     extract_token_counts,
     normalize_model_id,
+    parse_bedrock_payload,
     parse_bedrock_records,
+    parse_timestamp,
+    read_log_payload,
 )
 
 
@@ -15,7 +21,7 @@ def test_parse_records_counts():
         "AWSLogs/123456789012/BedrockModelInvocationLogs/us-east-2/2026/02/01/17/"
         "20260201T173052540Z_0b98d2144de6272e.json"
     )
-    records = parse_bedrock_records(path.read_bytes(), key=path.name)
+    records = parse_bedrock_records(path.read_bytes())
     assert len(records) == 1
     input_tokens, output_tokens, _ = extract_token_counts(records[0])
     assert input_tokens == 5000
@@ -27,10 +33,28 @@ def test_parse_records_multiple_lines():
         b'{"timestamp":"2026-02-01T00:00:00Z","input":{"inputTokenCount":1},"output":{"outputTokenCount":2}}\n'
         b'{"timestamp":"2026-02-01T00:00:01Z","input":{"inputTokenCount":3},"output":{"outputTokenCount":4}}\n'
     )
-    records = parse_bedrock_records(payload, key="inline.json")
+    records = parse_bedrock_records(payload)
     assert len(records) == 2
 
 
+def test_parse_records_accepts_compressed_and_decompressed_bytes():
+    payload = b'{"timestamp":"2026-02-01T00:00:00Z","input":{"inputTokenCount":1}}\n'
+    assert parse_bedrock_records(gzip.compress(payload)) == parse_bedrock_records(payload)
+
+
+@pytest.mark.parametrize("key", ["log.json.gz", "log.json"])
+def test_read_log_payload_decompresses_gzip(key: str):
+    payload = b'{"timestamp":"2026-02-01T00:00:00Z","input":{"inputTokenCount":1}}\n'
+    stream = io.BytesIO(gzip.compress(payload))
+    assert read_log_payload(stream, key) == payload
+    assert len(parse_bedrock_payload(payload)) == 1
+
+
+def test_read_log_payload_plain():
+    payload = b'[{"timestamp":"2026-02-01T00:00:00Z"}]'
+    assert read_log_payload(io.BytesIO(payload), "log.json") == payload
+
+
 @pytest.mark.parametrize(
     "model_id,expected",
     [
@@ -59,6 +83,21 @@ def test_parse_records_multiple_lines():
             "anthropic.claude-3-haiku-20240307-v1:0",
             "anthropic.claude-3-haiku-20240307-v1",
         ),
+        # Foundation model ARN (not an inference profile) - suffix stripped only
+        (
+            "arn:aws:bedrock:us-east-1::foundation-model/anthropic.claude-v2:1",
+            "arn:aws:bedrock:us-east-1::foundation-model/anthropic.claude-v2",
+        ),
+        # Inference profile without a known scope prefix - suffix stripped only
+        (
+            "arn:aws:bedrock:us-east-1:123456789012:inference-profile/xx.anthropic.claude-v2:0",
+            "arn:aws:bedrock:us-east-1:123456789012:inference-profile/xx.anthropic.claude-v2",
+        ),
+        # Empty account field is not a profile ARN
+        (
+            "arn:aws:bedrock:us-east-1::inference-profile/us.anthropic.claude-v2:0",
+            "arn:aws:bedrock:us-east-1::inference-profile/us.anthropic.claude-v2",
+        ),
         # Unknown / fallback - unchanged
         ("unknown", "unknown"),
         # Empty string - unchanged
@@ -77,3 +116,69 @@ def test_normalize_model_id_keeps_regional_and_global_separate():
     assert normalize_model_id(us_arn) == "us.anthropic.claude-opus-4-5-20251101-v1"
     assert normalize_model_id(global_arn) == "global.anthropic.claude-opus-4-5-20251101-v1"
     assert normalize_model_id(us_arn) != normalize_model_id(global_arn)
+
+
+def test_extract_token_counts_handles_missing_sections():
+    assert extract_token_counts({}) == (0, 0, False)
+    record = {
+        "input": None,
+        "output": {"outputTokenCount": 7, "outputBodyJson": {"usage": {"input_tokens": 11}}},
+    }
+    assert extract_token_counts(record) == (11, 7, True)
+
+
+def test_read_log_payload_streams_multi_member_gzip_without_suffix():
+    first = b'{"timestamp":"2026-02-01T00:00:00Z"}\n'
+    second = b'{"timestamp":"2026-02-01T00:00:01Z"}\n'
+    stream = io.BytesIO(gzip.compress(first) + gzip.compress(second))
+    assert read_log_payload(stream, "log") == first + second
+
+
+@pytest.mark.parametrize(
+    "payload,expected",
+    [
+        (b"", 0),
+        (b" \r\n\t ", 0),
+        (b'\n  [{"a": 1}, {"a": 2}]\n', 2),
+        (b'\r\n{\n  "a": 1\n}\r\n', 1),
+        (b'\n{"a": 1}\r\n\n{"a": 2}\n', 2),
+        (b'{"a": 1}\n' + b" " * 100_000 + b'\n{"a": 2}', 2),
+        (b'{"a": 1}\n\t\r\n  {"a": 2}  \r\n', 2),
+    ],
+)
+def test_parse_bedrock_payload_surrounding_whitespace(payload: bytes, expected: int):
+    assert len(parse_bedrock_payload(payload)) == expected
+
+
+@pytest.mark.parametrize(
+    "body,expected",
+    [
+        (b'"\\ud83d truncated emoji"', "\ud83d truncated emoji"),
+        (b'"invalid \xff byte"', "invalid \ufffd byte"),
+    ],
+)
+@pytest.mark.parametrize(
+    "template",
+    [b'{"output": {"outputBodyJson": %s}}', b'[{"output": {"outputBodyJson": %s}}]', b'{"a": 1}\n{"output": {"outputBodyJson": %s}}'],
+)
+def test_parse_bedrock_payload_tolerates_text_orjson_rejects(template: bytes, body: bytes, expected: str):
+    records = parse_bedrock_payload(template % body)
+    assert records[-1]["output"]["outputBodyJson"] == expected
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("2026-02-01T17:30:52.540Z", datetime(2026, 2, 1, 17, 30, 52, 540000, tzinfo=timezone.utc)),
+        ("2026-02-01T17:30:52+00:00", datetime(2026, 2, 1, 17, 30, 52, tzinfo=timezone.utc)),
+        ("2026-02-01T19:30:52+02:00", datetime(2026, 2, 1, 17, 30, 52, tzinfo=timezone.utc)),
+        ("not-a-timestamp", None),
+        (None, None),
+        (1738431052, None),
+    ],
+)
+def test_parse_timestamp(value, expected):
+    parsed = parse_timestamp({"timestamp": value})
+    assert parsed == expected
+    if parsed is not None:
+        assert parsed.tzinfo is timezone.utc
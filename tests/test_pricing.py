@@ -281,3 +281,30 @@ def test_unpriced_model_warnings():
     # Verify model appears in warnings
     assert model_id in warnings.unpriced_models
     assert metrics.totals.cost_usd == 0.0
+
+
+def test_pricing_yaml_reloaded_after_file_change(tmp_path):
+    """Cached pricing is reused until the file on disk changes."""
+    import os
+
+    path = tmp_path / "pricing.yaml"
+    path.write_text(yaml.safe_dump({"rates": {"model-a": {"default": {"input_per_1k": 0.001, "output_per_1k": 0.002}}}}))
+    first = StaticPricingProvider(pricing_path=path)
+    second = StaticPricingProvider(pricing_path=path)
+    assert first.get_rate("model-a", "us-east-1") is second.get_rate("model-a", "us-east-1")
+
+    path.write_text(yaml.safe_dump({"rates": {"model-a": {"default": {"input_per_1k": 0.003, "output_per_1k": 0.004}}}}))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    third = StaticPricingProvider(pricing_path=path)
+    rate = third.get_rate("model-a", "us-east-1")
+    assert rate is not None
+    assert rate.input_per_1k == 0.003
+
+    # The stale table is replaced rather than kept alongside the new one
+    from boostburn.adapters.pricing import _PRICING_CACHE
+
+    mtime_ns, size, rates = _PRICING_CACHE[str(path)]
+    assert (mtime_ns, size) == (path.stat().st_mtime_ns, path.stat().st_size)
+    assert rates["model-a"]["default"] is rate
@@ -1,5 +1,19 @@
+import importlib.util
+
+import pytest
+
+from boostburn import pricing_scraper
 from boostburn.pricing_scraper import parse_pricing_html
 
+_PARSERS = ["html.parser"] + (["lxml"] if importlib.util.find_spec("lxml") else [])
+
+
+@pytest.fixture(autouse=True, params=_PARSERS)
+def html_parser(request, monkeypatch):
+    # Every scraper test must hold for both the optional lxml backend and the stdlib fallback
+    monkeypatch.setattr(pricing_scraper, "_HTML_PARSER", request.param)
+    return request.param
+
 
 def test_parse_pricing_html_basic_table():
     html = """
@@ -82,3 +96,17 @@ def test_parse_pricing_html_inline_block():
     entry = rates["claude-3-opus"]["us-east-2"]
     assert entry["input_per_1k"] == 15.0
     assert entry["output_per_1k"] == 75.0
+
+
+def test_split_model_and_regions_orders_and_dedupes_regions():
+    model, regions = pricing_scraper._split_model_and_regions(
+        "Claude 3 Haiku US West (Oregon), US East (Ohio) and US West (Oregon)"
+    )
+    assert model == "Claude 3 Haiku"
+    assert regions == ["us-west-2", "us-east-2"]
+    assert pricing_scraper._split_model_and_regions("Claude 3 Haiku") == ("Claude 3 Haiku", [])
+
+
+def test_normalize_region_name_folds_accents():
+    assert pricing_scraper._normalize_region_name("South America (São Paulo)") == "south america (sao paulo)"
+    assert pricing_scraper._normalize_region_name("US East (Ohio)") == "us east (ohio)"
@@ -1,8 +1,8 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 from boostburn.adapters.report_store import ReportStore
 from boostburn.models import Metrics, Warnings
-from boostburn.reporting import CSV_FIELDS, build_csv_row, build_report_snapshot
+from boostburn.reporting import CSV_FIELDS, build_csv_row, build_report_snapshot, iso_times
 
 
 def test_build_report_snapshot_and_csv_row():
@@ -31,12 +31,11 @@ def test_build_report_snapshot_and_csv_row():
     report_start = datetime(2026, 1, 31, tzinfo=timezone.utc)
     report_end = datetime(2026, 2, 1, tzinfo=timezone.utc)
     generated_at = datetime(2026, 2, 1, tzinfo=timezone.utc)
+    report_iso_times = iso_times(report_start, report_end, generated_at)
 
     snapshot = build_report_snapshot(
         report_date="2026-01-31",
-        report_start=report_start,
-        report_end=report_end,
-        generated_at=generated_at,
+        iso_times=report_iso_times,
         metrics=metrics,
         warnings=warnings,
         stats=stats,
@@ -44,23 +43,38 @@ def test_build_report_snapshot_and_csv_row():
     )
 
     assert snapshot["report_date"] == "2026-01-31"
+    assert snapshot["report_start"] == "2026-01-31T00:00:00+00:00"
     assert snapshot["metrics"]["totals"]["total_tokens"] == 12
     assert snapshot["warnings"]["unpriced_models"] == ["model-x"]
     assert snapshot["stats"]["objects_listed"] == 3
 
     row = build_csv_row(
         report_date="2026-01-31",
-        report_start=report_start,
-        report_end=report_end,
-        generated_at=generated_at,
+        iso_times=report_iso_times,
         metrics=metrics,
         warnings=warnings,
         stats=stats,
     )
 
-    assert list(row.keys()) == CSV_FIELDS
-    assert row["total_tokens"] == 12
-    assert row["unpriced_models"] == "model-x"
+    assert len(row) == len(CSV_FIELDS)
+    values = dict(zip(CSV_FIELDS, row))
+    assert values["total_tokens"] == 12
+    assert values["unpriced_models"] == "model-x"
+    assert values["verification_errors"] == "by_region_mismatch"
+    assert (values["report_start"], values["report_end"], values["generated_at"]) == report_iso_times
+
+
+def test_iso_times_converts_to_utc():
+    plus_two = timezone(timedelta(hours=2))
+    assert iso_times(
+        datetime(2026, 2, 1, 2, tzinfo=plus_two),
+        datetime(2026, 2, 2, tzinfo=timezone.utc),
+        datetime(2026, 2, 2, 1, 30, tzinfo=plus_two),
+    ) == (
+        "2026-02-01T00:00:00+00:00",
+        "2026-02-02T00:00:00+00:00",
+        "2026-02-01T23:30:00+00:00",
+    )
 
 
 def test_report_store_writes_snapshot_and_csv(tmp_path):
@@ -72,18 +86,33 @@ def test_report_store_writes_snapshot_and_csv(tmp_path):
     snapshot = {"report_date": "2026-01-31", "metrics": {"totals": {"total_tokens": 12}}}
     snapshot_path = store.write_snapshot("2026-01-31", snapshot)
     assert snapshot_path.exists()
-    assert "report_date:" in snapshot_path.read_text(encoding="utf-8")
+    assert snapshot_path.suffix == ".json"
+    assert store.read_snapshot("2026-01-31") == snapshot
 
-    row = {field: "x" for field in CSV_FIELDS}
+    row = ["x"] * len(CSV_FIELDS)
     csv_path = store.append_csv_row(row, CSV_FIELDS)
     assert csv_path is not None
+    # Rows are buffered until close()
+    store.close()
     lines = csv_path.read_text(encoding="utf-8").splitlines()
     assert lines[0].split(",") == CSV_FIELDS
+    assert lines[1].split(",") == row
     assert len(lines) == 2
 
+    # Closing releases the handle; the next append reopens without a header
     store.append_csv_row(row, CSV_FIELDS)
+    store.close()
     lines = csv_path.read_text(encoding="utf-8").splitlines()
     assert len(lines) == 3
+    assert lines.count(lines[0]) == 1
+
+    # A fresh store appending to an existing CSV must not repeat the header
+    other = ReportStore(state_dir=tmp_path / "state", csv_path=csv_path)
+    other.append_csv_row(row, CSV_FIELDS)
+    other.close()
+    lines = csv_path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 4
+    assert lines.count(lines[0]) == 1
 
 
 def test_read_snapshot_missing(tmp_path):
@@ -95,6 +124,18 @@ def test_read_snapshot_missing(tmp_path):
     assert snapshot is None
 
 
+def test_read_snapshot_falls_back_to_legacy_yaml(tmp_path):
+    store = ReportStore(state_dir=tmp_path)
+    legacy = tmp_path / "bedrock-usage-2026-02-01.yaml"
+    legacy.write_text("report_date: '2026-02-01'\nmetrics:\n  totals:\n    total_tokens: 12\n", encoding="utf-8")
+
+    assert store.read_snapshot("2026-02-01") == {"report_date": "2026-02-01", "metrics": {"totals": {"total_tokens": 12}}}
+
+    # Once a JSON snapshot exists it wins over the legacy file
+    store.write_snapshot("2026-02-01", {"report_date": "2026-02-01", "metrics": {"totals": {"total_tokens": 30}}})
+    assert store.read_snapshot("2026-02-01")["metrics"]["totals"]["total_tokens"] == 30
+
+
 def test_read_snapshot_corrupted(tmp_path):
     """Reading a corrupted snapshot should return None gracefully."""
     from boostburn.adapters.report_store import ReportStore
@@ -102,9 +143,9 @@ def test_read_snapshot_corrupted(tmp_path):
     store = ReportStore(state_dir=tmp_path)
     tmp_path.mkdir(parents=True, exist_ok=True)
 
-    # Write invalid YAML
-    path = tmp_path / "bedrock-usage-2026-02-01.yaml"
-    path.write_text("{ invalid yaml [", encoding="utf-8")
+    # Write invalid JSON
+    path = tmp_path / "bedrock-usage-2026-02-01.json"
+    path.write_text("{ invalid json [", encoding="utf-8")
 
     snapshot = store.read_snapshot("2026-02-01")
     assert snapshot is None
@@ -151,3 +192,111 @@ def test_load_metrics_from_empty_snapshot():
     metrics = load_metrics_from_snapshot(snapshot)
     assert metrics is not None
     assert metrics.totals.total_tokens == 0
+
+
+def test_top_identities_keeps_five_largest_in_sorted_order():
+    from boostburn.reporting import _top_identities
+
+    metrics = Metrics()
+    for index, tokens in enumerate([3, 9, 1, 9, 4, 7, 2, 5]):
+        metrics.add_usage(
+            region="us-east-1",
+            identity=f"id-{index}",
+            model_id="model",
+            input_tokens=tokens,
+            output_tokens=0,
+            cost_usd=0.0,
+        )
+
+    expected = sorted(metrics.by_identity.items(), key=lambda item: item[1].total_tokens, reverse=True)[:5]
+    assert _top_identities(metrics) == expected
+    assert [identity for identity, _ in _top_identities(metrics)] == ["id-1", "id-3", "id-5", "id-7", "id-4"]
+
+
+def test_format_report_sections():
+    from boostburn.reporting import format_report
+
+    metrics = Metrics()
+    metrics.add_usage(
+        region="us-east-1",
+        identity="arn:example",
+        model_id="model",
+        input_tokens=1_200_000,
+        output_tokens=34_567,
+        cost_usd=0.0,
+    )
+    metrics.totals.cost_usd = 1234.5
+    metrics.by_region["us-east-1"].cost_usd = 1234.5
+    metrics.by_model["model"].cost_usd = 1234.5
+    metrics.by_identity["arn:example"].cost_usd = 1234.5
+    warnings = Warnings(missing_token_counts=2)
+
+    assert format_report("2026-01-31", metrics, warnings) == "\n".join(
+        [
+            "Bedrock usage report for 2026-01-31 (UTC)",
+            "Total tokens: 1,234,567 (input 1,200,000 / output 34,567)",
+            "Total cost: $1,234.5000",
+            "By region:",
+            "- us-east-1: 1,234,567 tokens ($1,234.5000)",
+            "By model:",
+            "- model: 1,234,567 tokens ($1,234.5000)",
+            "Top identities:",
+            "- arn:example: 1,234,567 tokens ($1,234.5000)",
+            "Warnings:",
+            "- 2 records missing token counts",
+        ]
+    )
+    assert format_report("2026-01-31", Metrics(), Warnings()) == (
+        "Bedrock usage report for 2026-01-31 (UTC)\nNo Bedrock usage recorded for this date."
+    )
+
+
+def test_snapshot_usage_keys_round_trip():
+    from boostburn.adapters.report_store import load_metrics_from_snapshot
+
+    metrics = Metrics()
+    metrics.add_usage(region="us-west-2", identity="b", model_id="m", input_tokens=3, output_tokens=4, cost_usd=0.0)
+    metrics.add_usage(region="us-east-1", identity="a", model_id="m", input_tokens=1, output_tokens=2, cost_usd=0.0)
+    snapshot = build_report_snapshot(
+        report_date="2026-01-31",
+        iso_times=("s", "e", "g"),
+        metrics=metrics,
+        warnings=Warnings(),
+        stats={},
+        report_text="",
+    )
+
+    entries = snapshot["metrics"]["by_usage_key"]
+    assert entries[0] == {
+        "region": "us-east-1",
+        "identity": "a",
+        "model_id": "m",
+        "input_tokens": 1,
+        "output_tokens": 2,
+        "total_tokens": 3,
+        "cost_usd": 0.0,
+    }
+    assert [entry["region"] for entry in entries] == ["us-east-1", "us-west-2"]
+    assert load_metrics_from_snapshot(snapshot).by_usage_key == metrics.by_usage_key
+
+
+def test_format_warnings_blocks():
+    from boostburn.reporting import _format_warnings
+
+    assert _format_warnings(Warnings()) == ""
+    warnings = Warnings(
+        unpriced_models={"arn:aws:bedrock:us-east-1::foundation-model/vendor.model-b", "vendor.model-a"},
+        records_skipped=3,
+    )
+    assert _format_warnings(warnings) == "\n".join(
+        [
+            "",
+            "UNPRICED MODELS DETECTED",
+            "The following models had $0.00 cost due to missing pricing:",
+            "  - vendor.model-b",
+            "  - vendor.model-a",
+            "",
+            "Action required: Update config/pricing.yaml with these model versions",
+            "- 3 records skipped due to missing fields",
+        ]
+    )
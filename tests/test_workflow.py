@@ -0,0 +1,197 @@
+import json
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from boostburn.adapters.local_s3 import LocalS3Adapter
+from boostburn.adapters.pricing import StaticPricingProvider
+from boostburn.adapters.report_store import ReportStore
+from boostburn.config import AppConfig
+from boostburn.graph.workflow import (
+    Dependencies,
+    RunConfig,
+    _append_skipped_records,
+    _hourly_prefixes,
+    _is_metadata_file,
+    _legacy_manifest_key,
+    _log_prefix_head,
+    _manifest_key,
+    _map_ordered,
+    _parse_datehour,
+    build_graph,
+)
+from boostburn.state.manifest import load_manifest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+@pytest.mark.parametrize(
+    "key,expected",
+    [
+        ("AWSLogs/123/BedrockModelInvocationLogs/us-east-2/2026/02/01/17/20260201T173052540Z_0b98d2144de6272e.json", True),
+        ("AWSLogs/123/BedrockModelInvocationLogs/us-east-2/2026/02/01/17/20260201T173052Z_abc123.json.gz", True),
+        ("20260201T173052540Z_0b98d2144de6272e.json", True),
+        ("AWSLogs/2026/02/01/17/data/5f1c_input.json.gz", False),
+        ("AWSLogs/2026/02/01/17/data/5f1c_output.json.gz", False),
+        ("AWSLogs/2026/02/01/17/data/0b98d214-4de6-272e-aaaa-bbbbccccdddd_input.json.gz", False),
+        ("AWSLogs/2026/02/01/17/20260201T173052540Z_abc_input.json.gz", False),
+        ("AWSLogs/amazon-bedrock-logs-permission-check.json", False),
+        ("AWSLogs/2026/02/01/17/20260201T173052540Z_0b98d2144de6272e.json.tmp", False),
+        ("AWSLogs/2026/02/01/17/20260201T173052540Z_XYZ.json", False),
+        ("manifests/bedrock-usage/manifest.json", False),
+    ],
+)
+def test_is_metadata_file(key: str, expected: bool):
+    assert _is_metadata_file(key) is expected
+
+
+@pytest.mark.parametrize(
+    "time_field,expected",
+    [
+        ("17305", False),
+        ("173052", True),
+        ("1730521", True),
+        ("17305212", True),
+        ("173052540", True),
+        ("1730525401", False),
+    ],
+)
+def test_is_metadata_file_time_field_lengths(time_field: str, expected: bool):
+    key = f"AWSLogs/2026/02/01/17/20260201T{time_field}Z_0b98d2144de6272e.json"
+    assert _is_metadata_file(key) is expected
+
+
+def test_append_skipped_records_appends_whole_lines(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    _append_skipped_records([b'{"reason":"no_timestamp","key":"a"}\n'])
+    _append_skipped_records([b'{"reason":"no_timestamp","key":"b"}\n', b'{"reason":"no_timestamp","key":"c"}\n'])
+
+    lines = (tmp_path / "debug" / "skipped_records.jsonl").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["key"] for line in lines] == ["a", "b", "c"]
+
+
+def test_log_prefix_head_skips_empty_parts():
+    config = AppConfig(account_id="123456789012", log_prefix="", regions={})
+    assert _log_prefix_head(config, "us-east-1") == "AWSLogs/123456789012/BedrockModelInvocationLogs/us-east-1/"
+
+    config = AppConfig(account_id="123456789012", log_prefix="bedrock", regions={})
+    assert _log_prefix_head(config, "us-west-2") == "bedrock/AWSLogs/123456789012/BedrockModelInvocationLogs/us-west-2/"
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("2026-02-01T17", datetime(2026, 2, 1, 17, tzinfo=timezone.utc)),
+        ("2026-12-31T00", datetime(2026, 12, 31, 0, tzinfo=timezone.utc)),
+        ("2026-02-30T10", None),
+        ("2026-02-01T24", None),
+        ("2026-02-01 17", None),
+        ("2026-02-01", None),
+        ("", None),
+    ],
+)
+def test_parse_datehour(value, expected):
+    assert _parse_datehour(value) == expected
+
+
+@pytest.mark.parametrize("hour_count", [0, 1, 5, 24, 30, 73])
+def test_hourly_prefixes_match_per_hour_formatting(hour_count):
+    start = datetime(2026, 2, 28, 21, tzinfo=timezone.utc)
+    expected = [f"head/{start + timedelta(hours=hour):%Y/%m/%d/%H}/" for hour in range(hour_count)]
+    assert _hourly_prefixes("head/", start, hour_count) == expected
+
+
+def test_map_ordered_preserves_order_and_bounds_in_flight_calls():
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def work(value: int) -> int:
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        # Later items finish first, so ordering comes from _map_ordered, not completion
+        time.sleep(0.001 * (10 - value))
+        with lock:
+            in_flight -= 1
+        return value * 2
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(_map_ordered(executor, work, range(10), window=3))
+    assert results == [value * 2 for value in range(10)]
+    assert peak <= 3
+
+
+def test_map_ordered_propagates_errors():
+    def work(value: int) -> int:
+        if value == 2:
+            raise ValueError("boom")
+        return value
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        with pytest.raises(ValueError):
+            list(_map_ordered(executor, work, range(5), window=2))
+
+
+def _shared_bucket_run(tmp_path):
+    fixture_buckets = REPO_ROOT / "evals" / "fixtures" / "buckets"
+    bucket_root = tmp_path / "shared-bucket"
+    for region in ("us-east-2", "us-west-2"):
+        shutil.copytree(fixture_buckets / f"bedrock-logs-123456789012-{region}" / "AWSLogs", bucket_root / "AWSLogs", dirs_exist_ok=True)
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(
+        'account_id: "123456789012"\nlog_prefix: ""\nregions:\n  us-east-2: shared-bucket\n  us-west-2: shared-bucket\n'
+    )
+    s3 = LocalS3Adapter({"shared-bucket": bucket_root})
+    deps = Dependencies(
+        s3=s3,
+        pricing=StaticPricingProvider(pricing_path=str(REPO_ROOT / "config" / "pricing.yaml")),
+        report_store=ReportStore(state_dir=tmp_path / "state"),
+        slack=None,
+        logger=MagicMock(),
+    )
+    run_config = RunConfig(
+        config_path=str(config_path),
+        report_date="2026-02-01",
+        now_fn=lambda: datetime(2026, 2, 2, 1, 0, tzinfo=timezone.utc),
+    )
+    return s3, deps, run_config
+
+
+def test_regions_sharing_a_bucket_keep_both_manifest_entries(tmp_path):
+    s3, deps, run_config = _shared_bucket_run(tmp_path)
+
+    build_graph(deps, run_config).invoke({})
+
+    for region in ("us-east-2", "us-west-2"):
+        manifest_key = _manifest_key(run_config.manifest_prefix, region)
+        manifest, _ = load_manifest(s3, "shared-bucket", manifest_key, lookback_hours=6)
+        assert {key.split("/")[3] for key in manifest.processed} == {region}
+
+
+def test_per_region_manifest_is_seeded_from_legacy_bucket_manifest(tmp_path):
+    s3, deps, run_config = _shared_bucket_run(tmp_path)
+    objects = s3.list_objects("shared-bucket", "AWSLogs/")
+    # Older per-bucket manifest, still carrying ISO seen_at values
+    legacy = {
+        "version": 1,
+        "last_datehour": "2026-02-01T23",
+        "processed": {obj.key: {"etag": obj.etag, "seen_at": "2026-02-02T00:30:00Z"} for obj in objects},
+        "lookback_hours": 6,
+    }
+    s3.put_object("shared-bucket", _legacy_manifest_key(run_config.manifest_prefix), json.dumps(legacy).encode())
+
+    result = build_graph(deps, run_config).invoke({})
+
+    assert result["stats"]["objects_processed"] == 0
+    for region in ("us-east-2", "us-west-2"):
+        manifest_key = _manifest_key(run_config.manifest_prefix, region)
+        manifest, _ = load_manifest(s3, "shared-bucket", manifest_key, lookback_hours=6)
+        assert {key.split("/")[3] for key in manifest.processed} == {region}